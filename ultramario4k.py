@@ -5,12 +5,21 @@ Enhanced with Wii-era visual effects, animations, and polish
 """
 
 import pygame
+import numpy as np
 import random
 import math
 from enum import Enum
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Tuple, Optional
 import colorsys
+from collections import deque, defaultdict
+from bisect import bisect_left, bisect_right
+
+try:
+    import numba
+except ImportError:  # Numba is optional; NumPy paths are used without it
+    numba = None
 
 # Initialize Pygame
 pygame.init()
@@ -22,6 +31,7 @@ GRAVITY = 0.8
 JUMP_STRENGTH = -16
 MOVE_SPEED = 6
 FPS = 60
+GRID_CELL_SIZE = 128
 
 # Enhanced Color Palette
 BLACK = (0, 0, 0)
@@ -37,6 +47,78 @@ OCEAN_BLUE = (0, 119, 190)
 CLOUD_WHITE = (245, 245, 245)
 SHADOW_COLOR = (0, 0, 0, 100)
 
+# Fully saturated rainbow colors, one per degree of hue
+HUE_LUT = tuple(tuple(int(c * 255) for c in colorsys.hsv_to_rgb(h / 360, 1, 1)) for h in range(360))
+
+def hue_to_rgb(degrees):
+    return HUE_LUT[int(degrees) % 360]
+
+# Sine table for per-frame animation curves, 1024 steps per turn
+SIN_LUT = tuple(math.sin(2 * math.pi * i / 1024) for i in range(1024))
+SIN_LUT_SCALE = 1024 / (2 * math.pi)
+SIN_LUT_ARRAY = np.array(SIN_LUT)
+
+def fsin(x):
+    return SIN_LUT[int(x * SIN_LUT_SCALE) & 1023]
+
+def fcos(x):
+    return SIN_LUT[(int(x * SIN_LUT_SCALE) + 256) & 1023]
+
+@lru_cache(maxsize=4096)
+def blend_colors(color1, color2, ratio_int):
+    # ratio_int is the weight of color1 in 256ths
+    ratio = ratio_int / 256
+    return tuple(int(c1 * ratio + c2 * (1 - ratio)) for c1, c2 in zip(color1, color2))
+
+# Unit directions of the twelve victory rays at zero rotation
+RAY_COS = np.cos(np.radians(np.arange(0, 360, 30)))
+RAY_SIN = np.sin(np.radians(np.arange(0, 360, 30)))
+
+# Component order per hue sector, indexing (v, t, p, q) as colorsys does
+HSV_SECTORS = np.array([[0, 1, 2], [3, 0, 2], [2, 0, 1], [2, 3, 0], [1, 2, 0], [0, 2, 3]])
+
+def hsv_to_rgb_array(h, s, v):
+    # Vectorized colorsys.hsv_to_rgb over an array of hues, same float steps
+    h = np.asarray(h, dtype=np.float64)
+    sector = (h * 6.0).astype(np.int64)
+    f = h * 6.0 - sector
+    p = np.full_like(h, v * (1.0 - s))
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    components = np.stack((np.full_like(h, v), t, p, q), axis=1)
+    return np.take_along_axis(components, HSV_SECTORS[sector % 6], axis=1)
+
+@lru_cache(maxsize=None)
+def get_font(size):
+    return pygame.font.Font(None, size)
+
+@lru_cache(maxsize=512)
+def render_text(size, text, color):
+    # Antialiased text in the default font, rasterized once per (size, text, color)
+    return get_font(size).render(text, True, color).convert_alpha()
+
+def gradient_surface(rows, width):
+    # Surface whose scanlines take the given (height, 3) colors: a one-pixel
+    # column built from the rows, stretched across the width in C
+    rows = np.asarray(rows).astype(np.uint8)
+    column = pygame.image.frombuffer(rows.tobytes(), (1, len(rows)), 'RGB')
+    return pygame.transform.scale(column, (width, len(rows)))
+
+HAS_FBLITS = hasattr(pygame.Surface, 'fblits')
+
+def batch_blit(target, blit_list, special_flags=0):
+    # One C-level call for many (source, dest) pairs; fblits where pygame has it
+    if HAS_FBLITS:
+        target.fblits(blit_list, special_flags)
+    elif special_flags:
+        target.blits([(source, dest, None, special_flags) for source, dest in blit_list], doreturn=False)
+    else:
+        target.blits(blit_list, doreturn=False)
+
+def rect_round(values):
+    # Round like pygame.Rect does on float assignment (half away from zero)
+    return np.trunc(values + np.copysign(0.5, values))
+
 class PowerUpType(Enum):
     NONE = 0
     MUSHROOM = 1
@@ -63,84 +145,185 @@ class WorldTheme:
     has_clouds: bool
     has_parallax: bool
 
-class Particle:
-    def __init__(self, x, y, vx, vy, color, lifetime, size=3, gravity=True):
-        self.x = x
-        self.y = y
-        self.vx = vx
-        self.vy = vy
-        self.color = color
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        self.size = size
-        self.gravity = gravity
-        self.alpha = 255
-    
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        if self.gravity:
-            self.vy += 0.3
-        self.lifetime -= 1
-        self.alpha = int(255 * (self.lifetime / self.max_lifetime))
-        return self.lifetime > 0
-    
-    def draw(self, screen, camera_x):
-        if self.alpha > 0:
-            color = (*self.color, min(self.alpha, 255))
-            pos = (int(self.x - camera_x), int(self.y))
-            
-            # Draw with glow effect
-            for i in range(3):
-                glow_alpha = max(0, self.alpha - i * 80)
-                if glow_alpha > 0:
-                    glow_size = self.size + i * 2
-                    glow_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-                    pygame.draw.circle(glow_surf, (*self.color, glow_alpha // 3), 
-                                     (glow_size, glow_size), glow_size)
-                    screen.blit(glow_surf, (pos[0] - glow_size, pos[1] - glow_size))
-            
-            # Main particle
-            particle_surf = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surf, color, (self.size, self.size), self.size)
-            screen.blit(particle_surf, (pos[0] - self.size, pos[1] - self.size))
+if numba is not None:
+    # Explicit signature over the ParticleSystem array dtypes, so the kernel
+    # compiles at import rather than on the first frame with live particles
+    @numba.njit(numba.int64(numba.float32[::1], numba.float32[::1], numba.float32[::1],
+                            numba.float32[::1], numba.int16[::1], numba.int16[::1],
+                            numba.int32[::1], numba.float32[::1], numba.uint8[:, ::1],
+                            numba.uint8[::1], numba.int64),
+                fastmath=True, cache=True, boundscheck=False)
+    def advance_particles(x, y, vx, vy, lifetime, max_lifetime, size, gravity, color, alpha, n):
+        # Fused integration and compaction over the first n particles;
+        # returns the number of survivors, packed to the front in order
+        alive = 0
+        for i in range(n):
+            life = lifetime[i] - 1
+            if life <= 0:
+                continue
+            x[alive] = x[i] + vx[i]
+            y[alive] = y[i] + vy[i]
+            vx[alive] = vx[i]
+            vy[alive] = vy[i] + 0.3 * gravity[i]
+            lifetime[alive] = life
+            max_lifetime[alive] = max_lifetime[i]
+            size[alive] = size[i]
+            gravity[alive] = gravity[i]
+            color[alive, 0] = color[i, 0]
+            color[alive, 1] = color[i, 1]
+            color[alive, 2] = color[i, 2]
+            alpha[alive] = (255 * life) // max_lifetime[i]
+            alive += 1
+        return alive
+else:
+    advance_particles = None
 
 class ParticleSystem:
+    MAX_PARTICLES = 4096
+    # Pre-rendered glow + core sprites keyed by (packed rgb, size, alpha >> 4)
+    _glow_cache = {}
+    
     def __init__(self):
-        self.particles = []
+        # Structure-of-arrays particle storage; live particles occupy [0, count)
+        n = self.MAX_PARTICLES
+        self.count = 0
+        self.x = np.zeros(n, np.float32)
+        self.y = np.zeros(n, np.float32)
+        self.vx = np.zeros(n, np.float32)
+        self.vy = np.zeros(n, np.float32)
+        self.lifetime = np.zeros(n, np.int16)
+        self.max_lifetime = np.ones(n, np.int16)
+        self.size = np.zeros(n, np.int32)
+        self.gravity = np.zeros(n, np.float32)
+        self.color = np.zeros((n, 3), np.uint8)
+        self.alpha = np.zeros(n, np.uint8)
+        self.arrays = (self.x, self.y, self.vx, self.vy, self.lifetime, self.max_lifetime,
+                       self.size, self.gravity, self.color, self.alpha)
     
     def add_particle(self, x, y, vx, vy, color, lifetime=30, size=3, gravity=True):
-        self.particles.append(Particle(x, y, vx, vy, color, lifetime, size, gravity))
+        i = self.count
+        if i >= self.MAX_PARTICLES:
+            return
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.lifetime[i] = lifetime
+        self.max_lifetime[i] = lifetime
+        self.size[i] = size
+        self.gravity[i] = 1.0 if gravity else 0.0
+        self.color[i] = color
+        self.alpha[i] = 255
+        self.count = i + 1
+    
+    def add_particles(self, x, y, vx, vy, color, lifetime, size, gravity=True):
+        # Bulk version of add_particle; any argument may be a per-particle array
+        start = self.count
+        n = min(len(vx), self.MAX_PARTICLES - start)
+        if n <= 0:
+            return
+        end = start + n
+        self.x[start:end] = np.broadcast_to(x, len(vx))[:n]
+        self.y[start:end] = np.broadcast_to(y, len(vx))[:n]
+        self.vx[start:end] = vx[:n]
+        self.vy[start:end] = vy[:n]
+        self.lifetime[start:end] = np.broadcast_to(lifetime, len(vx))[:n]
+        self.max_lifetime[start:end] = self.lifetime[start:end]
+        self.size[start:end] = np.broadcast_to(size, len(vx))[:n]
+        self.gravity[start:end] = 1.0 if gravity else 0.0
+        self.color[start:end] = np.broadcast_to(np.asarray(color, np.uint8), (len(vx), 3))[:n]
+        self.alpha[start:end] = 255
+        self.count = end
     
     def create_explosion(self, x, y, color, count=20):
-        for _ in range(count):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(2, 8)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            size = random.randint(2, 5)
-            lifetime = random.randint(20, 40)
-            self.add_particle(x, y, vx, vy, color, lifetime, size)
+        angle = np.random.uniform(0, math.pi * 2, count)
+        speed = np.random.uniform(2, 8, count)
+        self.add_particles(x, y, np.cos(angle) * speed, np.sin(angle) * speed, color,
+                           np.random.randint(20, 41, count), np.random.randint(2, 6, count))
     
     def create_sparkle(self, x, y, color):
-        for _ in range(5):
-            vx = random.uniform(-2, 2)
-            vy = random.uniform(-3, -1)
-            self.add_particle(x, y, vx, vy, color, 20, 2, True)
+        self.add_particles(x, y, np.random.uniform(-2, 2, 5), np.random.uniform(-3, -1, 5),
+                           color, 20, 2, True)
     
     def create_trail(self, x, y, color, direction=1):
-        for i in range(3):
-            offset_x = -direction * i * 5
-            vx = -direction * random.uniform(0.5, 1.5)
-            vy = random.uniform(-0.5, 0.5)
-            self.add_particle(x + offset_x, y, vx, vy, color, 15, 2, False)
+        offset_x = -direction * np.arange(3) * 5
+        self.add_particles(x + offset_x, y, -direction * np.random.uniform(0.5, 1.5, 3),
+                           np.random.uniform(-0.5, 0.5, 3), color, 15, 2, False)
     
     def update(self):
-        self.particles = [p for p in self.particles if p.update()]
+        n = self.count
+        if n == 0:
+            return
+        
+        if advance_particles is not None:
+            self.count = advance_particles(*self.arrays, n)
+            return
+        
+        lifetime = self.lifetime[:n]
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        self.vy[:n] += 0.3 * self.gravity[:n]
+        lifetime -= 1
+        self.alpha[:n] = lifetime.astype(np.int32) * 255 // self.max_lifetime[:n]
+        
+        # Compact survivors to the front of the arrays
+        alive = lifetime > 0
+        new_n = int(np.count_nonzero(alive))
+        if new_n < n:
+            for arr in self.arrays:
+                arr[:new_n] = arr[:n][alive]
+        self.count = new_n
+    
+    @classmethod
+    def glow_sprite(cls, rgb, size, alpha_level):
+        key = (rgb, size, alpha_level)
+        surf = cls._glow_cache.get(key)
+        if surf is None:
+            color = ((rgb >> 16) & 255, (rgb >> 8) & 255, rgb & 255)
+            alpha = alpha_level * 16 + 15
+            center = size + 4
+            surf = pygame.Surface((center * 2, center * 2), pygame.SRCALPHA)
+            
+            # Glow layers, outermost first, then the core
+            for i in reversed(range(3)):
+                glow_alpha = max(0, alpha - i * 80)
+                if glow_alpha > 0:
+                    glow_size = size + i * 2
+                    glow_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
+                    pygame.draw.circle(glow_surf, (*color, glow_alpha // 3), 
+                                     (glow_size, glow_size), glow_size)
+                    surf.blit(glow_surf, (center - glow_size, center - glow_size))
+            
+            particle_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(particle_surf, (*color, alpha), (size, size), size)
+            surf.blit(particle_surf, (center - size, center - size))
+            cls._glow_cache[key] = surf
+        return surf
     
     def draw(self, screen, camera_x):
-        for particle in self.particles:
-            particle.draw(screen, camera_x)
+        n = self.count
+        if n == 0:
+            return
+        
+        # Skip particles outside the view
+        screen_x = self.x[:n] - camera_x
+        visible = (screen_x > -16) & (screen_x < screen.get_width() + 16)
+        color = self.color[:n][visible].astype(np.int32)
+        rgbs = ((color[:, 0] << 16) | (color[:, 1] << 8) | color[:, 2]).tolist()
+        xs = screen_x[visible].astype(np.int32).tolist()
+        ys = self.y[:n][visible].astype(np.int32).tolist()
+        sizes = self.size[:n][visible].tolist()
+        alpha_levels = (self.alpha[:n][visible] >> 4).tolist()
+        
+        glow_cache = self._glow_cache
+        blit_list = []
+        for px, py, size, alpha_level, rgb in zip(xs, ys, sizes, alpha_levels, rgbs):
+            sprite = glow_cache.get((rgb, size, alpha_level))
+            if sprite is None:
+                sprite = self.glow_sprite(rgb, size, alpha_level)
+            offset = size + 4
+            blit_list.append((sprite, (px - offset, py - offset)))
+        batch_blit(screen, blit_list)
 
 class GameObject(pygame.sprite.Sprite):
     def __init__(self, x, y, width, height, color):
@@ -161,7 +344,7 @@ class GameObject(pygame.sprite.Sprite):
         # Create gradient effect
         for y in range(height):
             progress = y / height
-            color = self.blend_colors(base_color, (255, 255, 255), 1 - progress * 0.3)
+            color = blend_colors(tuple(base_color), WHITE, int((1 - progress * 0.3) * 256))
             pygame.draw.line(surface, color, (0, y), (width, y))
         
         # Add border highlight
@@ -174,9 +357,22 @@ class GameObject(pygame.sprite.Sprite):
         return surface
     
     def blend_colors(self, color1, color2, ratio):
-        return tuple(int(c1 * ratio + c2 * (1 - ratio)) for c1, c2 in zip(color1, color2))
+        return blend_colors(tuple(color1), tuple(color2), int(ratio * 256))
+
+def step_actor(x, y, vx, vy, invincible_timer, fire_cooldown, animation_time, run_animation):
+    # Numeric part of an actor tick: gravity, movement and timers
+    vy += GRAVITY
+    x += vx
+    y += vy
+    if vx != 0:
+        run_animation += abs(vx) * 0.2
+    return (x, y, vy, max(invincible_timer - 1, 0), max(fire_cooldown - 1, 0),
+            animation_time + 1, run_animation)
 
 class Player(GameObject):
+    # Rendered sprites keyed by (power_up, facing_right, hue_bucket)
+    _sprite_cache = {}
+    
     def __init__(self, x, y):
         super().__init__(x, y, 36, 36, BRIGHT_RED)
         self.power_up = PowerUpType.NONE
@@ -189,83 +385,95 @@ class Player(GameObject):
         self.jump_particles_created = False
         self.run_animation = 0
         self.star_colors = []
+        self.sprite_key = None
         self.create_character_sprite()
     
     def create_character_sprite(self):
-        size = (36, 48) if self.power_up in [PowerUpType.MUSHROOM, PowerUpType.FIRE_FLOWER, PowerUpType.ICE_FLOWER] else (36, 36)
-        self.image = pygame.Surface(size, pygame.SRCALPHA)
+        # Star power cycles through 24 hue buckets; every other look is static
+        hue_bucket = int(self.animation_time * 5) % 360 // 15 if self.power_up == PowerUpType.STAR else 0
+        key = (self.power_up, self.facing_right, hue_bucket)
+        if key == self.sprite_key:
+            return
+        self.sprite_key = key
+        
+        image = Player._sprite_cache.get(key)
+        if image is None:
+            image = self.render_character_sprite(self.power_up, self.facing_right, hue_bucket * 15)
+            Player._sprite_cache[key] = image
+        self.image = image
+        
+        # Update rect
+        old_rect = self.rect
+        self.rect = self.image.get_rect()
+        self.rect.centerx = old_rect.centerx
+        self.rect.bottom = old_rect.bottom
+    
+    def render_character_sprite(self, power_up, facing_right, hue):
+        size = (36, 48) if power_up in [PowerUpType.MUSHROOM, PowerUpType.FIRE_FLOWER, PowerUpType.ICE_FLOWER] else (36, 36)
+        image = pygame.Surface(size, pygame.SRCALPHA)
         
         # Body color based on power-up
-        if self.power_up == PowerUpType.FIRE_FLOWER:
+        if power_up == PowerUpType.FIRE_FLOWER:
             body_color = (255, 100, 100)
             accent_color = WHITE
-        elif self.power_up == PowerUpType.ICE_FLOWER:
+        elif power_up == PowerUpType.ICE_FLOWER:
             body_color = (100, 200, 255)
             accent_color = WHITE
-        elif self.power_up == PowerUpType.STAR:
+        elif power_up == PowerUpType.STAR:
             # Rainbow effect
-            hue = (self.animation_time * 5) % 360
-            body_color = self.hsv_to_rgb(hue / 360, 1, 1)
+            body_color = hue_to_rgb(hue)
             accent_color = WHITE
         else:
             body_color = BRIGHT_RED
             accent_color = (139, 69, 19)
         
         # Draw character with details
-        if self.power_up in [PowerUpType.MUSHROOM, PowerUpType.FIRE_FLOWER, PowerUpType.ICE_FLOWER]:
+        if power_up in [PowerUpType.MUSHROOM, PowerUpType.FIRE_FLOWER, PowerUpType.ICE_FLOWER]:
             # Super Mario (taller)
             # Head
-            pygame.draw.ellipse(self.image, body_color, (8, 4, 20, 20))
+            pygame.draw.ellipse(image, body_color, (8, 4, 20, 20))
             # Eyes
-            pygame.draw.circle(self.image, WHITE, (14, 12), 3)
-            pygame.draw.circle(self.image, BLACK, (15, 12), 2)
-            pygame.draw.circle(self.image, WHITE, (22, 12), 3)
-            pygame.draw.circle(self.image, BLACK, (21, 12), 2)
+            pygame.draw.circle(image, WHITE, (14, 12), 3)
+            pygame.draw.circle(image, BLACK, (15, 12), 2)
+            pygame.draw.circle(image, WHITE, (22, 12), 3)
+            pygame.draw.circle(image, BLACK, (21, 12), 2)
             # Body
-            pygame.draw.rect(self.image, accent_color, (10, 20, 16, 20))
+            pygame.draw.rect(image, accent_color, (10, 20, 16, 20))
             # Arms
-            pygame.draw.rect(self.image, body_color, (5, 24, 6, 12))
-            pygame.draw.rect(self.image, body_color, (25, 24, 6, 12))
+            pygame.draw.rect(image, body_color, (5, 24, 6, 12))
+            pygame.draw.rect(image, body_color, (25, 24, 6, 12))
             # Legs
-            pygame.draw.rect(self.image, accent_color, (12, 36, 6, 12))
-            pygame.draw.rect(self.image, accent_color, (18, 36, 6, 12))
+            pygame.draw.rect(image, accent_color, (12, 36, 6, 12))
+            pygame.draw.rect(image, accent_color, (18, 36, 6, 12))
         else:
             # Small Mario
             # Head
-            pygame.draw.ellipse(self.image, body_color, (8, 2, 20, 18))
+            pygame.draw.ellipse(image, body_color, (8, 2, 20, 18))
             # Eyes
-            pygame.draw.circle(self.image, WHITE, (14, 9), 2)
-            pygame.draw.circle(self.image, BLACK, (14, 9), 1)
-            pygame.draw.circle(self.image, WHITE, (22, 9), 2)
-            pygame.draw.circle(self.image, BLACK, (22, 9), 1)
+            pygame.draw.circle(image, WHITE, (14, 9), 2)
+            pygame.draw.circle(image, BLACK, (14, 9), 1)
+            pygame.draw.circle(image, WHITE, (22, 9), 2)
+            pygame.draw.circle(image, BLACK, (22, 9), 1)
             # Body
-            pygame.draw.rect(self.image, accent_color, (11, 16, 14, 14))
+            pygame.draw.rect(image, accent_color, (11, 16, 14, 14))
             # Arms
-            pygame.draw.rect(self.image, body_color, (6, 18, 5, 8))
-            pygame.draw.rect(self.image, body_color, (25, 18, 5, 8))
+            pygame.draw.rect(image, body_color, (6, 18, 5, 8))
+            pygame.draw.rect(image, body_color, (25, 18, 5, 8))
             # Legs
-            pygame.draw.rect(self.image, accent_color, (12, 26, 5, 10))
-            pygame.draw.rect(self.image, accent_color, (19, 26, 5, 10))
+            pygame.draw.rect(image, accent_color, (12, 26, 5, 10))
+            pygame.draw.rect(image, accent_color, (19, 26, 5, 10))
         
         # Add glow effect for star power
-        if self.power_up == PowerUpType.STAR:
+        if power_up == PowerUpType.STAR:
             glow_surf = pygame.Surface((size[0] + 20, size[1] + 20), pygame.SRCALPHA)
             pygame.draw.ellipse(glow_surf, (*body_color, 50), glow_surf.get_rect())
-            self.image.blit(glow_surf, (-10, -10))
+            image.blit(glow_surf, (-10, -10))
         
         # Flip if facing left
-        if not self.facing_right:
-            self.image = pygame.transform.flip(self.image, True, False)
+        if not facing_right:
+            image = pygame.transform.flip(image, True, False)
         
-        # Update rect
-        old_rect = self.rect
-        self.rect = self.image.get_rect()
-        self.rect.centerx = old_rect.centerx
-        self.rect.bottom = old_rect.bottom
-    
-    def hsv_to_rgb(self, h, s, v):
-        rgb = colorsys.hsv_to_rgb(h, s, v)
-        return tuple(int(c * 255) for c in rgb)
+        return image
     
     def jump(self):
         if self.on_ground:
@@ -273,28 +481,23 @@ class Player(GameObject):
             self.jump_particles_created = False
     
     def update(self):
-        self.vy += GRAVITY
-        self.rect.x += self.vx
-        self.rect.y += self.vy
-        
-        self.animation_time += 1
-        
-        if self.vx != 0:
-            self.run_animation += abs(self.vx) * 0.2
-        
-        if self.invincible_timer > 0:
-            self.invincible_timer -= 1
-            if self.invincible_timer == 0 and self.power_up == PowerUpType.STAR:
-                self.power_up = PowerUpType.NONE
-                self.create_character_sprite()
+        was_invincible = self.invincible_timer > 0
+        (self.rect.x, self.rect.y, self.vy, self.invincible_timer, self.fire_cooldown,
+         self.animation_time, self.run_animation) = step_actor(
+            self.rect.x, self.rect.y, self.vx, self.vy, self.invincible_timer,
+            self.fire_cooldown, self.animation_time, self.run_animation)
         
-        if self.fire_cooldown > 0:
-            self.fire_cooldown -= 1
+        if was_invincible and self.invincible_timer == 0 and self.power_up == PowerUpType.STAR:
+            self.power_up = PowerUpType.NONE
+            self.create_character_sprite()
         
         # Update sprite
         self.create_character_sprite()
 
 class AnimatedPlatform(GameObject):
+    # Platform surfaces keyed by (width, height, base color); never mutated, so shared
+    _visual_cache = {}
+    
     def __init__(self, x, y, width, height, colors):
         super().__init__(x, y, width, height, colors[0])
         self.colors = colors
@@ -308,28 +511,40 @@ class AnimatedPlatform(GameObject):
         self.create_platform_visual()
     
     def create_platform_visual(self):
+        key = (self.rect.width, self.rect.height, tuple(self.colors[0]))
+        image = AnimatedPlatform._visual_cache.get(key)
+        if image is None:
+            image = self.render_platform_visual()
+            AnimatedPlatform._visual_cache[key] = image
+        self.image = image
+    
+    def render_platform_visual(self):
         # Create a detailed platform with texture
-        self.image = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-        
-        # Base gradient
-        for y in range(self.rect.height):
-            progress = y / self.rect.height
-            if progress < 0.1:  # Top highlight
-                color = self.blend_colors(self.colors[0], WHITE, 0.7)
-            elif progress < 0.3:  # Main color
-                color = self.colors[0]
-            else:  # Shadow
-                color = self.blend_colors(self.colors[0], BLACK, 0.7 - progress * 0.3)
-            
-            pygame.draw.line(self.image, color, (0, y), (self.rect.width, y))
+        image = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
+        
+        # Base gradient, one RGB row per scanline broadcast across the width
+        progress = np.arange(self.rect.height)[:, None] / self.rect.height
+        base = np.asarray(self.colors[0], dtype=np.float64)
+        highlight = base * 0.7 + np.asarray(WHITE) * (1 - 0.7)  # Top highlight
+        shadow = base * (0.7 - progress * 0.3)  # Shadow
+        rows = np.where(progress < 0.1, highlight, np.where(progress < 0.3, base, shadow))
+        
+        pixels = pygame.surfarray.pixels3d(image)
+        pixels[:] = rows.astype(np.uint8)[None, :, :]
+        del pixels
+        alpha = pygame.surfarray.pixels_alpha(image)
+        alpha[:] = 255
+        del alpha
         
         # Add texture details
         for i in range(0, self.rect.width, 20):
-            pygame.draw.line(self.image, (0, 0, 0, 30), (i, 0), (i, self.rect.height), 1)
+            pygame.draw.line(image, (0, 0, 0, 30), (i, 0), (i, self.rect.height), 1)
         
         # Edge highlights
-        pygame.draw.rect(self.image, (255, 255, 255, 100), (0, 0, self.rect.width, 3))
-        pygame.draw.rect(self.image, (0, 0, 0, 100), (0, self.rect.height - 3, self.rect.width, 3))
+        pygame.draw.rect(image, (255, 255, 255, 100), (0, 0, self.rect.width, 3))
+        pygame.draw.rect(image, (0, 0, 0, 100), (0, self.rect.height - 3, self.rect.width, 3))
+        
+        return image
     
     def update(self):
         if self.is_moving:
@@ -342,6 +557,15 @@ class AnimatedPlatform(GameObject):
                 if abs(self.rect.x - self.start_x) > self.move_range:
                     self.direction *= -1
 
+# Pre-rendered enemy animation: ENEMY_FRAMES[enemy_type][phase] = (facing_right, facing_left)
+ENEMY_FRAMES = {}
+ENEMY_ANIMATION_PHASES = 16
+ENEMY_ANIMATION_SPEEDS = {
+    EnemyType.GOOMBA: 0.2,
+    EnemyType.KOOPA: 0.15,
+    EnemyType.BOO: 0.1
+}
+
 class AnimatedEnemy(GameObject):
     def __init__(self, x, y, enemy_type):
         self.enemy_type = enemy_type
@@ -374,8 +598,33 @@ class AnimatedEnemy(GameObject):
         self.squash_timer = 0
         self.create_enemy_sprite()
     
+    def animation_phase(self):
+        speed = ENEMY_ANIMATION_SPEEDS.get(self.enemy_type, 0)
+        return int(self.animation_frame * speed * ENEMY_ANIMATION_PHASES / (2 * math.pi)) % ENEMY_ANIMATION_PHASES
+    
     def create_enemy_sprite(self):
-        self.image = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
+        facing = 1 if self.vx < 0 else 0
+        frames = ENEMY_FRAMES.get(self.enemy_type)
+        if frames is None:
+            # Types without an animation speed never leave phase 0
+            animated = ENEMY_ANIMATION_SPEEDS.get(self.enemy_type, 0)
+            phases = ENEMY_ANIMATION_PHASES if animated else 1
+            frames = [self.render_enemy_facings(phase) for phase in range(phases)]
+            ENEMY_FRAMES[self.enemy_type] = frames
+        self.image = frames[self.animation_phase()][facing]
+    
+    def render_enemy_facings(self, phase):
+        # Boo shows a different face when turned away; everyone else is mirrored
+        right = self.render_enemy_frame(phase, False)
+        if self.enemy_type == EnemyType.BOO:
+            left = self.render_enemy_frame(phase, True)
+        else:
+            left = pygame.transform.flip(right, True, False)
+        return right, left
+    
+    def render_enemy_frame(self, phase, facing_left):
+        image = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
+        angle = phase * 2 * math.pi / ENEMY_ANIMATION_PHASES
         
         if self.enemy_type == EnemyType.GOOMBA:
             # Goomba with animation
@@ -383,43 +632,43 @@ class AnimatedEnemy(GameObject):
             
             # Body
             body_rect = pygame.Rect(4, 8 * body_squash, 24, 20 * body_squash)
-            pygame.draw.ellipse(self.image, (139, 90, 43), body_rect)
+            pygame.draw.ellipse(image, (139, 90, 43), body_rect)
             
             # Feet animation
-            foot_offset = math.sin(self.animation_frame * 0.2) * 2
-            pygame.draw.ellipse(self.image, BLACK, (6, 24 + foot_offset, 8, 6))
-            pygame.draw.ellipse(self.image, BLACK, (18, 24 - foot_offset, 8, 6))
+            foot_offset = math.sin(angle) * 2
+            pygame.draw.ellipse(image, BLACK, (6, 24 + foot_offset, 8, 6))
+            pygame.draw.ellipse(image, BLACK, (18, 24 - foot_offset, 8, 6))
             
             # Eyes
-            pygame.draw.circle(self.image, WHITE, (10, 14), 3)
-            pygame.draw.circle(self.image, BLACK, (10, 15), 2)
-            pygame.draw.circle(self.image, WHITE, (22, 14), 3)
-            pygame.draw.circle(self.image, BLACK, (22, 15), 2)
+            pygame.draw.circle(image, WHITE, (10, 14), 3)
+            pygame.draw.circle(image, BLACK, (10, 15), 2)
+            pygame.draw.circle(image, WHITE, (22, 14), 3)
+            pygame.draw.circle(image, BLACK, (22, 15), 2)
             
         elif self.enemy_type == EnemyType.KOOPA:
             # Koopa turtle
             # Shell
             shell_color = (0, 200, 0)
-            pygame.draw.ellipse(self.image, shell_color, (4, 16, 28, 24))
+            pygame.draw.ellipse(image, shell_color, (4, 16, 28, 24))
             
             # Shell pattern
             for i in range(3):
-                pygame.draw.arc(self.image, (0, 150, 0), 
+                pygame.draw.arc(image, (0, 150, 0), 
                                (8 + i*8, 18, 8, 20), 0, math.pi, 2)
             
             # Head
-            pygame.draw.ellipse(self.image, (255, 200, 150), (10, 4, 16, 14))
+            pygame.draw.ellipse(image, (255, 200, 150), (10, 4, 16, 14))
             
             # Eyes
-            pygame.draw.circle(self.image, WHITE, (14, 9), 2)
-            pygame.draw.circle(self.image, BLACK, (14, 9), 1)
-            pygame.draw.circle(self.image, WHITE, (20, 9), 2)
-            pygame.draw.circle(self.image, BLACK, (20, 9), 1)
+            pygame.draw.circle(image, WHITE, (14, 9), 2)
+            pygame.draw.circle(image, BLACK, (14, 9), 1)
+            pygame.draw.circle(image, WHITE, (20, 9), 2)
+            pygame.draw.circle(image, BLACK, (20, 9), 1)
             
             # Legs
-            leg_offset = math.sin(self.animation_frame * 0.15) * 3
-            pygame.draw.rect(self.image, (255, 200, 150), (8, 36 + leg_offset, 6, 10))
-            pygame.draw.rect(self.image, (255, 200, 150), (22, 36 - leg_offset, 6, 10))
+            leg_offset = math.sin(angle) * 3
+            pygame.draw.rect(image, (255, 200, 150), (8, 36 + leg_offset, 6, 10))
+            pygame.draw.rect(image, (255, 200, 150), (22, 36 - leg_offset, 6, 10))
         
         elif self.enemy_type == EnemyType.BOO:
             # Ghost enemy
@@ -427,70 +676,64 @@ class AnimatedEnemy(GameObject):
             
             # Body (circular ghost)
             ghost_color = (*WHITE, alpha)
-            pygame.draw.circle(self.image, ghost_color, (20, 20), 18)
+            pygame.draw.circle(image, ghost_color, (20, 20), 18)
             
             # Wavy bottom
             for i in range(5):
-                wave_y = 32 + math.sin(self.animation_frame * 0.1 + i) * 3
-                pygame.draw.circle(self.image, ghost_color, (8 + i*6, int(wave_y)), 4)
+                wave_y = 32 + math.sin(angle + i) * 3
+                pygame.draw.circle(image, ghost_color, (8 + i*6, int(wave_y)), 4)
             
             # Face
-            if self.vx > 0:  # Facing right
+            if not facing_left:  # Facing right
                 # Eyes
-                pygame.draw.ellipse(self.image, BLACK, (12, 14, 4, 6))
-                pygame.draw.ellipse(self.image, BLACK, (24, 14, 4, 6))
+                pygame.draw.ellipse(image, BLACK, (12, 14, 4, 6))
+                pygame.draw.ellipse(image, BLACK, (24, 14, 4, 6))
                 # Mouth
-                pygame.draw.arc(self.image, BLACK, (14, 22, 12, 8), 0, math.pi, 2)
+                pygame.draw.arc(image, BLACK, (14, 22, 12, 8), 0, math.pi, 2)
             else:  # Shy (facing away)
                 # Blush
-                pygame.draw.circle(self.image, (255, 150, 150, 100), (10, 20), 3)
-                pygame.draw.circle(self.image, (255, 150, 150, 100), (30, 20), 3)
+                pygame.draw.circle(image, (255, 150, 150, 100), (10, 20), 3)
+                pygame.draw.circle(image, (255, 150, 150, 100), (30, 20), 3)
         
         elif self.enemy_type == EnemyType.BULLET:
             # Bullet Bill
             # Body
-            pygame.draw.ellipse(self.image, (64, 64, 64), self.image.get_rect())
+            pygame.draw.ellipse(image, (64, 64, 64), image.get_rect())
             # Highlight
-            pygame.draw.ellipse(self.image, (128, 128, 128), (4, 4, 24, 16))
+            pygame.draw.ellipse(image, (128, 128, 128), (4, 4, 24, 16))
             # Eyes
-            pygame.draw.circle(self.image, WHITE, (8, 12), 3)
-            pygame.draw.circle(self.image, BLACK, (8, 12), 2)
-            pygame.draw.circle(self.image, WHITE, (16, 12), 3)
-            pygame.draw.circle(self.image, BLACK, (16, 12), 2)
+            pygame.draw.circle(image, WHITE, (8, 12), 3)
+            pygame.draw.circle(image, BLACK, (8, 12), 2)
+            pygame.draw.circle(image, WHITE, (16, 12), 3)
+            pygame.draw.circle(image, BLACK, (16, 12), 2)
         
         # Add shadow
         shadow_surf = pygame.Surface((self.rect.width + 8, 8), pygame.SRCALPHA)
         pygame.draw.ellipse(shadow_surf, (0, 0, 0, 50), shadow_surf.get_rect())
         
-        # Direction flip
-        if self.vx < 0 and self.enemy_type != EnemyType.BOO:
-            self.image = pygame.transform.flip(self.image, True, False)
+        return image
     
     def update(self):
-        self.animation_frame += 1
-        
+        # Movement and animation_frame are advanced for all enemies at once
+        # by World.update_enemies
         if self.squash_timer > 0:
             self.squash_timer -= 1
         
-        if self.enemy_type == EnemyType.BULLET:
-            self.rect.x += self.vx * 3
-        elif self.enemy_type == EnemyType.PIRANHA:
-            # Bobbing motion
-            self.rect.y = self.start_x + math.sin(self.animation_frame * 0.05) * 20
-        elif self.enemy_type == EnemyType.BOO:
-            # Float toward player when not looking
-            pass  # Implement if player reference available
-        else:
-            self.rect.x += self.vx
-            if abs(self.rect.x - self.start_x) > self.patrol_distance:
-                self.vx *= -1
-        
-        self.vy += GRAVITY
-        self.rect.y += self.vy
-        
         # Update sprite
         self.create_enemy_sprite()
 
+# Cached power-up artwork keyed by (power_type, rotation_frame), and glow
+# circles keyed by (power_type, radius, alpha)
+POWERUP_ARTWORK = {}
+POWERUP_GLOWS = {}
+POWERUP_ROTATION_FRAMES = 32
+# Spinning power-ups: (degrees per frame, degrees until the shape repeats)
+POWERUP_ROTATIONS = {
+    PowerUpType.FIRE_FLOWER: (1, 360),
+    PowerUpType.STAR: (2, 72),
+    PowerUpType.ICE_FLOWER: (0.5, 60)
+}
+
 class AnimatedPowerUp(GameObject):
     def __init__(self, x, y, power_type):
         self.power_type = power_type
@@ -504,47 +747,75 @@ class AnimatedPowerUp(GameObject):
         self.collected = False
         self.float_offset = random.random() * math.pi * 2
         self.glow_animation = 0
+        self.image = pygame.Surface((40, 40), pygame.SRCALPHA)
         self.create_powerup_sprite()
     
     def create_powerup_sprite(self):
-        self.image = pygame.Surface((40, 40), pygame.SRCALPHA)
-        
         # Glow effect
-        glow_radius = 18 + math.sin(self.glow_animation * 0.1) * 3
-        glow_alpha = 100 + math.sin(self.glow_animation * 0.15) * 30
+        glow_radius = 18 + fsin(self.glow_animation * 0.1) * 3
+        glow_alpha = 100 + fsin(self.glow_animation * 0.15) * 30
+        
+        speed, period = POWERUP_ROTATIONS.get(self.power_type, (0, 360))
+        frame = int(self.glow_animation * speed % period * POWERUP_ROTATION_FRAMES / period)
+        layers = POWERUP_ARTWORK.get((self.power_type, frame))
+        if layers is None:
+            layers = self.render_powerup_layers(frame * period / POWERUP_ROTATION_FRAMES)
+            POWERUP_ARTWORK[(self.power_type, frame)] = layers
+        
+        self.image.fill((0, 0, 0, 0))
+        self.image.blit(layers[0], (0, 0))
+        if self.power_type == PowerUpType.STAR:
+            # Tint the white star with the rainbow color, then add the outline
+            self.image.fill(hue_to_rgb(self.glow_animation * 3), special_flags=pygame.BLEND_RGB_MULT)
+            self.image.blit(layers[1], (0, 0))
+        
+        # Add glow
+        self.image.blit(self.glow_sprite(int(glow_radius), int(glow_alpha) & ~7), (-5, -5))
+    
+    def glow_sprite(self, radius, alpha):
+        key = (self.power_type, radius, alpha)
+        glow_surf = POWERUP_GLOWS.get(key)
+        if glow_surf is None:
+            glow_surf = pygame.Surface((50, 50), pygame.SRCALPHA)
+            pygame.draw.circle(glow_surf, (*self.get_glow_color(), alpha), (25, 25), radius)
+            POWERUP_GLOWS[key] = glow_surf
+        return glow_surf
+    
+    def render_powerup_layers(self, rotation):
+        image = pygame.Surface((40, 40), pygame.SRCALPHA)
         
         if self.power_type == PowerUpType.MUSHROOM:
             # Mushroom
             # Stem
-            pygame.draw.rect(self.image, WHITE, (16, 22, 8, 10))
+            pygame.draw.rect(image, WHITE, (16, 22, 8, 10))
             # Cap
-            pygame.draw.ellipse(self.image, BRIGHT_RED, (8, 10, 24, 16))
+            pygame.draw.ellipse(image, BRIGHT_RED, (8, 10, 24, 16))
             # Dots
-            pygame.draw.circle(self.image, WHITE, (14, 16), 2)
-            pygame.draw.circle(self.image, WHITE, (26, 16), 2)
-            pygame.draw.circle(self.image, WHITE, (20, 14), 2)
+            pygame.draw.circle(image, WHITE, (14, 16), 2)
+            pygame.draw.circle(image, WHITE, (26, 16), 2)
+            pygame.draw.circle(image, WHITE, (20, 14), 2)
             
         elif self.power_type == PowerUpType.FIRE_FLOWER:
             # Fire Flower
             # Stem
-            pygame.draw.rect(self.image, (0, 200, 0), (18, 24, 4, 8))
+            pygame.draw.rect(image, (0, 200, 0), (18, 24, 4, 8))
             # Petals (animated)
             petal_colors = [SUNSET_ORANGE, GOLD, BRIGHT_RED]
             for i in range(8):
-                angle = (i * 45 + self.glow_animation) * math.pi / 180
+                angle = (i * 45 + rotation) * math.pi / 180
                 x = 20 + math.cos(angle) * 8
                 y = 16 + math.sin(angle) * 8
                 color = petal_colors[i % 3]
-                pygame.draw.circle(self.image, color, (int(x), int(y)), 4)
+                pygame.draw.circle(image, color, (int(x), int(y)), 4)
             # Center
-            pygame.draw.circle(self.image, GOLD, (20, 16), 3)
+            pygame.draw.circle(image, GOLD, (20, 16), 3)
             
         elif self.power_type == PowerUpType.STAR:
             # Animated Star
             # Draw star shape
             star_points = []
             for i in range(10):
-                angle = (i * 36 - 90 + self.glow_animation * 2) * math.pi / 180
+                angle = (i * 36 - 90 + rotation) * math.pi / 180
                 if i % 2 == 0:
                     radius = 12
                 else:
@@ -553,26 +824,26 @@ class AnimatedPowerUp(GameObject):
                 y = 20 + math.sin(angle) * radius
                 star_points.append((x, y))
             
-            # Rainbow color
-            hue = (self.glow_animation * 3) % 360
-            color = self.hsv_to_rgb(hue / 360, 1, 1)
-            pygame.draw.polygon(self.image, color, star_points)
+            # White body, tinted per frame
+            pygame.draw.polygon(image, WHITE, star_points)
             
             # Inner glow
-            pygame.draw.polygon(self.image, WHITE, star_points, 2)
+            outline = pygame.Surface((40, 40), pygame.SRCALPHA)
+            pygame.draw.polygon(outline, WHITE, star_points, 2)
+            return image, outline
             
         elif self.power_type == PowerUpType.ICE_FLOWER:
             # Ice Flower
             # Stem
-            pygame.draw.rect(self.image, (100, 150, 200), (18, 24, 4, 8))
+            pygame.draw.rect(image, (100, 150, 200), (18, 24, 4, 8))
             # Ice crystal petals
             for i in range(6):
-                angle = (i * 60 + self.glow_animation * 0.5) * math.pi / 180
+                angle = (i * 60 + rotation) * math.pi / 180
                 x1 = 20 + math.cos(angle) * 4
                 y1 = 16 + math.sin(angle) * 4
                 x2 = 20 + math.cos(angle) * 10
                 y2 = 16 + math.sin(angle) * 10
-                pygame.draw.line(self.image, (150, 200, 255), 
+                pygame.draw.line(image, (150, 200, 255), 
                                (int(x1), int(y1)), (int(x2), int(y2)), 3)
                 # Crystal branches
                 branch_angle1 = angle - 0.3
@@ -581,18 +852,14 @@ class AnimatedPowerUp(GameObject):
                 by1 = y2 - math.sin(branch_angle1) * 4
                 bx2 = x2 - math.cos(branch_angle2) * 4
                 by2 = y2 - math.sin(branch_angle2) * 4
-                pygame.draw.line(self.image, (200, 230, 255),
+                pygame.draw.line(image, (200, 230, 255),
                                (int(x2), int(y2)), (int(bx1), int(by1)), 2)
-                pygame.draw.line(self.image, (200, 230, 255),
+                pygame.draw.line(image, (200, 230, 255),
                                (int(x2), int(y2)), (int(bx2), int(by2)), 2)
             # Center
-            pygame.draw.circle(self.image, WHITE, (20, 16), 3)
+            pygame.draw.circle(image, WHITE, (20, 16), 3)
         
-        # Add glow
-        glow_surf = pygame.Surface((50, 50), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surf, (*self.get_glow_color(), int(glow_alpha)), 
-                         (25, 25), int(glow_radius))
-        self.image.blit(glow_surf, (-5, -5))
+        return (image,)
     
     def get_glow_color(self):
         colors = {
@@ -603,17 +870,21 @@ class AnimatedPowerUp(GameObject):
         }
         return colors[self.power_type]
     
-    def hsv_to_rgb(self, h, s, v):
-        rgb = colorsys.hsv_to_rgb(h, s, v)
-        return tuple(int(c * 255) for c in rgb)
-    
     def update(self):
         self.glow_animation += 1
-        # Floating animation
+        # Floating animation; math.sin stays below 1 here, whereas the table's
+        # exact crest would make 0.5 round away from zero and drift the power-up
         self.rect.y += math.sin(pygame.time.get_ticks() * 0.003 + self.float_offset) * 0.5
         self.create_powerup_sprite()
 
+# Pre-rendered coin frames keyed by (spin_phase, sparkle_phase)
+COIN_FRAMES = {}
+COIN_SPIN_PHASES = 16
+COIN_SPARKLE_PHASES = 16
+
 class AnimatedCoin(GameObject):
+    _dollar_text = None
+    
     def __init__(self, x, y):
         super().__init__(x, y, 24, 24, GOLD)
         self.collected = False
@@ -621,10 +892,22 @@ class AnimatedCoin(GameObject):
         self.float_offset = random.random() * math.pi * 2
         
     def create_coin_sprite(self):
-        self.image = pygame.Surface((32, 32), pygame.SRCALPHA)
+        spin_phase = int(self.spin_angle * COIN_SPIN_PHASES / (2 * math.pi)) % COIN_SPIN_PHASES
+        sparkle_angle = pygame.time.get_ticks() * 0.01
+        sparkle_phase = int(sparkle_angle * COIN_SPARKLE_PHASES / (2 * math.pi)) % COIN_SPARKLE_PHASES
+        
+        key = (spin_phase, sparkle_phase)
+        image = COIN_FRAMES.get(key)
+        if image is None:
+            image = self.render_coin_frame(spin_phase, sparkle_phase)
+            COIN_FRAMES[key] = image
+        self.image = image
+    
+    def render_coin_frame(self, spin_phase, sparkle_phase):
+        image = pygame.Surface((32, 32), pygame.SRCALPHA)
         
         # Spinning effect
-        width_scale = abs(math.cos(self.spin_angle))
+        width_scale = abs(math.cos(spin_phase * 2 * math.pi / COIN_SPIN_PHASES))
         coin_width = int(20 * width_scale)
         if coin_width < 2:
             coin_width = 2
@@ -635,42 +918,52 @@ class AnimatedCoin(GameObject):
         # Metallic gradient
         if width_scale > 0.3:
             # Coin face visible
-            pygame.draw.ellipse(self.image, GOLD, coin_rect)
-            pygame.draw.ellipse(self.image, (255, 245, 100), coin_rect.inflate(-4, -4))
+            pygame.draw.ellipse(image, GOLD, coin_rect)
+            pygame.draw.ellipse(image, (255, 245, 100), coin_rect.inflate(-4, -4))
             
             # Embossed effect
             if width_scale > 0.7:
-                font = pygame.font.Font(None, 16)
-                text = font.render("$", True, GOLD)
+                if AnimatedCoin._dollar_text is None:
+                    AnimatedCoin._dollar_text = get_font(16).render("$", True, GOLD)
+                text = AnimatedCoin._dollar_text
                 text_rect = text.get_rect(center=(16, 16))
-                self.image.blit(text, text_rect)
+                image.blit(text, text_rect)
         else:
             # Edge view
-            pygame.draw.rect(self.image, (200, 180, 0), coin_rect)
+            pygame.draw.rect(image, (200, 180, 0), coin_rect)
         
         # Sparkle effect
-        sparkle_angle = pygame.time.get_ticks() * 0.01
+        sparkle_angle = sparkle_phase * 2 * math.pi / COIN_SPARKLE_PHASES
         sparkle_x = 16 + math.cos(sparkle_angle) * 8
         sparkle_y = 16 + math.sin(sparkle_angle) * 8
-        pygame.draw.circle(self.image, WHITE, (int(sparkle_x), int(sparkle_y)), 2)
+        pygame.draw.circle(image, WHITE, (int(sparkle_x), int(sparkle_y)), 2)
+        
+        return image
     
     def update(self):
         self.spin_angle += 0.15
         # Floating animation
-        self.rect.y += math.sin(pygame.time.get_ticks() * 0.003 + self.float_offset) * 0.3
+        self.rect.y += fsin(pygame.time.get_ticks() * 0.003 + self.float_offset) * 0.3
         self.create_coin_sprite()
 
 class Fireball(GameObject):
     def __init__(self, x, y, direction, is_ice=False):
         color = (150, 200, 255) if is_ice else SUNSET_ORANGE
         super().__init__(x, y, 16, 16, color)
+        self.max_bounces = 3
+        self.trail_positions = deque(maxlen=5)
+        self.reset(x, y, direction, is_ice)
+    
+    def reset(self, x, y, direction, is_ice=False):
+        self.rect.x = x
+        self.rect.y = y
         self.vx = 10 * direction
         self.vy = -5
         self.bounces = 0
-        self.max_bounces = 3
         self.is_ice = is_ice
         self.rotation = 0
-        self.trail_positions = []
+        self.removed = False
+        self.trail_positions.clear()
         
     def create_fireball_sprite(self):
         self.image = pygame.Surface((24, 24), pygame.SRCALPHA)
@@ -683,9 +976,9 @@ class Fireball(GameObject):
             
             # Ice crystals
             for i in range(6):
-                angle = i * 60 + self.rotation
-                x = 12 + math.cos(math.radians(angle)) * 10
-                y = 12 + math.sin(math.radians(angle)) * 10
+                angle = (i * 60 + self.rotation) * math.pi / 180
+                x = 12 + fcos(angle) * 10
+                y = 12 + fsin(angle) * 10
                 pygame.draw.line(self.image, (150, 200, 255), 
                                (12, 12), (int(x), int(y)), 2)
         else:
@@ -697,9 +990,9 @@ class Fireball(GameObject):
             # Flames
             for i in range(8):
                 angle = i * 45 + self.rotation
-                flame_length = 8 + math.sin(angle * 0.1) * 3
-                x = 12 + math.cos(math.radians(angle)) * flame_length
-                y = 12 + math.sin(math.radians(angle)) * flame_length
+                flame_length = 8 + fsin(angle * 0.1) * 3
+                x = 12 + fcos(angle * math.pi / 180) * flame_length
+                y = 12 + fsin(angle * math.pi / 180) * flame_length
                 pygame.draw.line(self.image, SUNSET_ORANGE, 
                                (12, 12), (int(x), int(y)), 2)
     
@@ -709,10 +1002,8 @@ class Fireball(GameObject):
         self.rect.x += self.vx
         self.rect.y += self.vy
         
-        # Store trail positions
+        # Store trail positions; the deque drops the oldest beyond five
         self.trail_positions.append((self.rect.centerx, self.rect.centery))
-        if len(self.trail_positions) > 5:
-            self.trail_positions.pop(0)
         
         self.create_fireball_sprite()
 
@@ -723,6 +1014,7 @@ class Cloud:
         self.size = size
         self.speed = random.uniform(0.2, 0.5)
         self.shape = self.generate_cloud_shape()
+        self.surface, self.offset = self.render_cloud()
     
     def generate_cloud_shape(self):
         circles = []
@@ -733,44 +1025,69 @@ class Cloud:
             circles.append((cx, cy, radius))
         return circles
     
-    def update(self):
-        self.x += self.speed
-    
-    def draw(self, screen, camera_x):
-        # Parallax effect
-        draw_x = self.x - camera_x * 0.3
+    def render_cloud(self):
+        # Bounding box of all circles including the shadow offset
+        left = min(cx - radius for cx, cy, radius in self.shape)
+        top = min(cy - radius for cx, cy, radius in self.shape)
+        right = max(cx + radius + 2 for cx, cy, radius in self.shape)
+        bottom = max(cy + radius + 2 for cx, cy, radius in self.shape)
+        surface = pygame.Surface((right - left + 1, bottom - top + 1), pygame.SRCALPHA)
         
         for cx, cy, radius in self.shape:
+            x = cx - left
+            y = cy - top
             # Shadow
-            pygame.draw.circle(screen, (200, 200, 200, 100), 
-                             (int(draw_x + cx + 2), int(self.y + cy + 2)), radius)
+            pygame.draw.circle(surface, (200, 200, 200), (x + 2, y + 2), radius)
             # Main cloud
-            pygame.draw.circle(screen, CLOUD_WHITE, 
-                             (int(draw_x + cx), int(self.y + cy)), radius)
+            pygame.draw.circle(surface, CLOUD_WHITE, (x, y), radius)
             # Highlight
-            pygame.draw.circle(screen, WHITE, 
-                             (int(draw_x + cx - radius//3), int(self.y + cy - radius//3)), 
-                             radius//3)
+            pygame.draw.circle(surface, WHITE, (x - radius//3, y - radius//3), radius//3)
+        
+        return surface, (left, top)
+    
+    def update(self):
+        self.x += self.speed
 
 class World:
     def __init__(self, world_num, theme):
         self.world_num = world_num
         self.theme = theme
         self.platforms = pygame.sprite.Group()
-        self.enemies = pygame.sprite.Group()
-        self.power_ups = pygame.sprite.Group()
-        self.coins = pygame.sprite.Group()
+        self.moving_platforms = []
+        self.platform_grid = {}
+        # Enemies, coins and power-ups by grid cell, kept current as they move
+        self.collision_grid = defaultdict(list)
+        self.enemies = []
+        self.power_ups = []
+        self.coins = []
+        # Sprites killed or collected this frame, swept from the lists in one pass
+        self.removed = set()
         self.fireballs = pygame.sprite.Group()
+        self.fireball_pool = []
         self.flag = None
         self.spawn_point = (100, 400)
         self.camera_x = 0
+        # Whole-pixel camera position for drawing, refreshed by update_camera
+        self.camera_x_int = 0
         self.level_width = 4000 + world_num * 500
         self.clouds = []
         self.background_objects = []
+        self.parallax_layers = []
         self.particle_system = ParticleSystem()
+        # Reused each frame for the platform shadow pass
+        self.shadow_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
         
         self.generate_level()
         self.generate_background()
+        self.gradient_surface = self.render_gradient_background()
+        self.build_enemy_arrays()
+        for group in (self.enemies, self.coins, self.power_ups):
+            for sprite in group:
+                self.grid_insert(sprite)
+        
+        # Coins and power-ups never move horizontally, so an x-sorted index stays valid
+        self.coins_by_x = self.index_by_x(self.coins)
+        self.power_ups_by_x = self.index_by_x(self.power_ups)
     
     def generate_level(self):
         # Generate varied terrain
@@ -781,7 +1098,7 @@ class World:
                 # Platform colors based on theme
                 platform = AnimatedPlatform(i, SCREEN_HEIGHT - height, 100, height, 
                                            self.theme.platform_colors)
-                self.platforms.add(platform)
+                self.add_platform(platform)
                 
                 # Floating platforms
                 if i > 400 and random.random() > 0.5:
@@ -796,7 +1113,7 @@ class World:
                         float_platform.move_speed = random.uniform(1, 3)
                         float_platform.vertical_moving = random.random() > 0.5
                     
-                    self.platforms.add(float_platform)
+                    self.add_platform(float_platform)
         
         # Add enemies with variety
         enemy_count = 8 + self.world_num * 4
@@ -807,7 +1124,7 @@ class World:
             y = random.randint(100, 400)
             enemy_type = random.choice(enemy_types)
             enemy = AnimatedEnemy(x, y, enemy_type)
-            self.enemies.add(enemy)
+            self.enemies.append(enemy)
         
         # Add power-ups
         power_count = 4 + self.world_num * 2
@@ -818,7 +1135,7 @@ class World:
                           PowerUpType.STAR, PowerUpType.ICE_FLOWER]
             power_type = random.choice(power_types)
             power_up = AnimatedPowerUp(x, y, power_type)
-            self.power_ups.add(power_up)
+            self.power_ups.append(power_up)
         
         # Add coins in patterns
         coin_count = 30 + self.world_num * 10
@@ -830,17 +1147,159 @@ class World:
                     x = base_x + j * 30
                     y = 300 - abs(j - 2) * 40
                     coin = AnimatedCoin(x, y)
-                    self.coins.add(coin)
+                    self.coins.append(coin)
             else:
                 # Random placement
                 x = random.randint(200, self.level_width - 100)
                 y = random.randint(150, 450)
                 coin = AnimatedCoin(x, y)
-                self.coins.add(coin)
+                self.coins.append(coin)
         
         # Add flag
         self.flag = GameObject(self.level_width - 200, 150, 30, 300, self.theme.accent_color)
     
+    def build_enemy_arrays(self):
+        # Enemy physics state as parallel arrays, advanced together each frame
+        self.enemy_list = list(self.enemies)
+        enemies = self.enemy_list
+        type_id = np.array([enemy.enemy_type.value for enemy in enemies])
+        bullet = type_id == EnemyType.BULLET.value
+        piranha = type_id == EnemyType.PIRANHA.value
+        boo = type_id == EnemyType.BOO.value
+        self.enemy_soa = {
+            'x': np.array([enemy.rect.x for enemy in enemies], np.float64),
+            'y': np.array([enemy.rect.y for enemy in enemies], np.float64),
+            'vx': np.array([enemy.vx for enemy in enemies], np.float64),
+            'vy': np.array([enemy.vy for enemy in enemies], np.float64),
+            'start_x': np.array([enemy.start_x for enemy in enemies], np.float64),
+            'patrol_distance': np.array([enemy.patrol_distance for enemy in enemies], np.float64),
+            'animation_frame': np.array([enemy.animation_frame for enemy in enemies], np.int64),
+            'type_id': type_id,
+            'bullet': bullet,
+            'piranha': piranha,
+            'walker': ~(bullet | piranha | boo)
+        }
+    
+    def update_enemies(self):
+        soa = self.enemy_soa
+        x, y, vx, vy = soa['x'], soa['y'], soa['vx'], soa['vy']
+        start_x = soa['start_x']
+        frame = soa['animation_frame']
+        bullet, piranha, walker = soa['bullet'], soa['piranha'], soa['walker']
+        
+        frame += 1
+        x[bullet] = rect_round(x[bullet] + vx[bullet] * 3)
+        
+        # Piranha bobbing motion
+        phase = (frame[piranha] * 0.05 * SIN_LUT_SCALE).astype(np.int64) & 1023
+        y[piranha] = rect_round(start_x[piranha] + SIN_LUT_ARRAY[phase] * 20)
+        
+        # Boo would float toward the player when not looking; it has no player
+        # reference yet, so it only falls
+        x[walker] = rect_round(x[walker] + vx[walker])
+        turn = walker & (np.abs(x - start_x) > soa['patrol_distance'])
+        vx[turn] *= -1
+        
+        vy += GRAVITY
+        y[:] = rect_round(y + vy)
+        
+        # Write back into the sprites for collision and drawing; only enemies
+        # near the view pick a new animation frame
+        view_left, view_right = self.visible_range()
+        for enemy, ex, ey, evx, evy, eframe in zip(self.enemy_list, x.tolist(), y.tolist(),
+                                                   vx.tolist(), vy.tolist(), frame.tolist()):
+            if enemy.alive:
+                # Enemies that have fallen out of the level are gone for good
+                if ey > SCREEN_HEIGHT:
+                    enemy.alive = False
+                    self.discard(enemy)
+                    continue
+                enemy.rect.x = ex
+                enemy.rect.y = ey
+                enemy.vx = evx
+                enemy.vy = evy
+                enemy.animation_frame = eframe
+                self.grid_move(enemy)
+                if view_left < ex < view_right:
+                    enemy.update()
+    
+    def add_platform(self, platform):
+        self.platforms.add(platform)
+        
+        # Moving platforms are hashed over the whole span they sweep
+        bounds = platform.rect.copy()
+        if platform.is_moving:
+            self.moving_platforms.append(platform)
+            reach = platform.move_range + math.ceil(platform.move_speed)
+            if platform.vertical_moving:
+                bounds.inflate_ip(0, reach * 2)
+            else:
+                bounds.inflate_ip(reach * 2, 0)
+        for cell in self.grid_cells(bounds):
+            self.platform_grid.setdefault(cell, []).append(platform)
+    
+    def grid_span(self, rect):
+        return (rect.left // GRID_CELL_SIZE, rect.top // GRID_CELL_SIZE,
+                (rect.right - 1) // GRID_CELL_SIZE, (rect.bottom - 1) // GRID_CELL_SIZE)
+    
+    def span_cells(self, span):
+        left, top, right, bottom = span
+        for cx in range(left, right + 1):
+            for cy in range(top, bottom + 1):
+                yield cx, cy
+    
+    def grid_cells(self, rect):
+        return self.span_cells(self.grid_span(rect))
+    
+    def grid_insert(self, sprite):
+        sprite.grid_span = self.grid_span(sprite.rect)
+        for cell in self.span_cells(sprite.grid_span):
+            self.collision_grid[cell].append(sprite)
+    
+    def grid_remove(self, sprite):
+        # Empty cells are dropped so the grid only holds occupied ones
+        grid = self.collision_grid
+        for cell in self.span_cells(sprite.grid_span):
+            cell_list = grid[cell]
+            cell_list.remove(sprite)
+            if not cell_list:
+                del grid[cell]
+    
+    def grid_move(self, sprite):
+        # Re-hash only when the sprite has crossed a cell boundary
+        if self.grid_span(sprite.rect) != sprite.grid_span:
+            self.grid_remove(sprite)
+            self.grid_insert(sprite)
+    
+    def query_nearby(self, rect, kind):
+        # Sprites of the given class sharing a grid cell with rect
+        found = {}
+        for cell in self.grid_cells(rect):
+            for sprite in self.collision_grid.get(cell, ()):
+                if isinstance(sprite, kind):
+                    found[sprite] = None
+        return list(found)
+    
+    def discard(self, sprite):
+        self.grid_remove(sprite)
+        self.removed.add(sprite)
+    
+    def sweep_removed(self):
+        if self.removed:
+            removed = self.removed
+            self.enemies = [enemy for enemy in self.enemies if enemy not in removed]
+            self.power_ups = [power_up for power_up in self.power_ups if power_up not in removed]
+            self.coins = [coin for coin in self.coins if coin not in removed]
+            removed.clear()
+    
+    def query(self, rect):
+        # Platforms sharing a grid cell with rect, without duplicates
+        found = {}
+        for cell in self.grid_cells(rect):
+            for platform in self.platform_grid.get(cell, ()):
+                found[platform] = None
+        return list(found)
+    
     def generate_background(self):
         if self.theme.has_clouds:
             # Generate clouds
@@ -864,40 +1323,118 @@ class World:
                         'layer': random.choice([0.5, 0.7])  # Parallax depth
                     }
                     self.background_objects.append(obj)
+            
+            # Bake each parallax depth into one wide strip
+            for layer in sorted({obj['layer'] for obj in self.background_objects}):
+                self.parallax_layers.append(self.render_parallax_layer(layer))
+    
+    def render_parallax_layer(self, layer):
+        objects = [obj for obj in self.background_objects if obj['layer'] == layer]
+        left = min(obj['x'] for obj in objects)
+        top = min(obj['y'] for obj in objects)
+        width = max(obj['x'] + obj['width'] for obj in objects) - left + 1
+        strip = pygame.Surface((width, SCREEN_HEIGHT - top), pygame.SRCALPHA)
+        for obj in objects:
+            x = obj['x'] - left
+            y = obj['y'] - top
+            # Mountain/hill shape
+            points = [
+                (x, y + obj['height']),
+                (x + obj['width'] // 4, y),
+                (x + obj['width'] * 3 // 4, y + obj['height'] // 3),
+                (x + obj['width'], y + obj['height'])
+            ]
+            pygame.draw.polygon(strip, obj['color'], points)
+        return layer, strip, left, top
+    
+    def spawn_fireball(self, x, y, direction, is_ice):
+        # Reuse a spent fireball when one is available
+        if self.fireball_pool:
+            fireball = self.fireball_pool.pop()
+            fireball.reset(x, y, direction, is_ice)
+        else:
+            fireball = Fireball(x, y, direction, is_ice)
+        self.fireballs.add(fireball)
+        return fireball
+    
+    def recycle_fireball(self, fireball):
+        if not fireball.removed:
+            fireball.removed = True
+            self.fireballs.remove(fireball)
+            self.fireball_pool.append(fireball)
     
     def blend_color_with_alpha(self, color, alpha):
         return tuple(int(c * alpha) for c in color)
     
+    def visible_range(self, margin=256):
+        return self.camera_x - margin, self.camera_x + SCREEN_WIDTH + margin
+    
+    def index_by_x(self, group):
+        sprites = sorted(group, key=lambda sprite: sprite.rect.x)
+        return sprites, [sprite.rect.x for sprite in sprites]
+    
+    def in_view(self, index, margin=256):
+        # Sprites of an x index strictly inside the visible range
+        sprites, xs = index
+        view_left, view_right = self.visible_range(margin)
+        return sprites[bisect_right(xs, view_left):bisect_left(xs, view_right)]
+    
     def update_camera(self, player_x):
         target_x = player_x - SCREEN_WIDTH // 2
         # Smooth camera movement
         self.camera_x += (target_x - self.camera_x) * 0.1
         self.camera_x = max(0, min(self.camera_x, self.level_width - SCREEN_WIDTH))
+        self.camera_x_int = int(self.camera_x)
     
-    def draw_gradient_background(self, screen):
-        # Draw gradient sky
+    def draw_parallax(self, screen):
+        for layer, strip, left, top in self.parallax_layers:
+            screen.blit(strip, (int(left - self.camera_x * layer), top))
+    
+    def draw_clouds(self, screen):
+        blit_list = []
+        for cloud in self.clouds:
+            # Parallax effect
+            draw_x = int(cloud.x - self.camera_x * 0.3) + cloud.offset[0]
+            if -cloud.surface.get_width() < draw_x < SCREEN_WIDTH:
+                blit_list.append((cloud.surface, (draw_x, cloud.y + cloud.offset[1])))
+        batch_blit(screen, blit_list)
+    
+    def render_gradient_background(self):
+        # Gradient sky, one row per scanline
+        rows = np.zeros((SCREEN_HEIGHT, 3))
         for i, color in enumerate(self.theme.bg_gradient):
             y = i * (SCREEN_HEIGHT // len(self.theme.bg_gradient))
             height = SCREEN_HEIGHT // len(self.theme.bg_gradient) + 1
+            band = rows[y:y + height]
             
             # Smooth gradient between colors
             if i < len(self.theme.bg_gradient) - 1:
                 next_color = self.theme.bg_gradient[i + 1]
-                for j in range(height):
-                    progress = j / height
-                    blended = tuple(int(color[k] * (1 - progress) + next_color[k] * progress) 
-                                  for k in range(3))
-                    pygame.draw.line(screen, blended, (0, y + j), (SCREEN_WIDTH, y + j))
+                progress = (np.arange(height) / height)[:len(band), None]
+                band[:] = np.trunc(np.asarray(color, dtype=np.float64) * (1 - progress) +
+                                   np.asarray(next_color, dtype=np.float64) * progress)
             else:
-                pygame.draw.rect(screen, color, (0, y, SCREEN_WIDTH, height))
+                band[:] = color
+        return gradient_surface(rows, SCREEN_WIDTH).convert()
+    
+    def draw_gradient_background(self, screen):
+        screen.blit(self.gradient_surface, (0, 0))
 
 class Game:
+    _overlay_cache = {}
+    # Number keys that pick a world from the menu, in world order
+    WORLD_KEYS = (pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4, pygame.K_5)
+    # Fireball trail dots, oldest first, keyed by (is_ice, trail length)
+    _trail_atlas = {}
+    # Victory ray wheels keyed by whole degrees of rotation
+    _ray_wheels = {}
+    
     def __init__(self):
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Super Mario Bros 2D - Modern Graphics Edition")
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font(None, 48)
-        self.small_font = pygame.font.Font(None, 32)
+        self.font = get_font(48)
+        self.small_font = get_font(32)
         
         self.world_themes = [
             WorldTheme("Mushroom Kingdom", 
@@ -934,143 +1471,262 @@ class Game:
         self.high_score = 0
         self.transition_alpha = 0
         self.menu_animation = 0
+        # Menu selections from this frame's KEYDOWN / MOUSEBUTTONDOWN events
+        self.pending_world = None
+        self.pending_click = None
+        # Key state from the previous frame, for edge-triggered transitions
+        self.prev_keys = pygame.key.get_pressed()
+        self.frame_time = 0
+        self.drawn_state = None
+        self.high_pulse_index = None
+        
+        # Static menu sky and per-world preview gradients, keyed by their colors
+        progress = np.arange(SCREEN_HEIGHT)[:, None] / SCREEN_HEIGHT
+        self.menu_background = gradient_surface(
+            np.array([135, 206, 250]) + progress * np.array([50, -50, -100]), SCREEN_WIDTH
+        ).convert()
+        self.preview_gradients = {}
+        
+        # End screen skies: a static dark red fade, and two stacked hue cycles
+        # that the victory screen scrolls through
+        self.game_over_background = gradient_surface(
+            np.column_stack((50 - progress[:, 0] * 50, np.zeros((SCREEN_HEIGHT, 2)))), SCREEN_WIDTH
+        ).convert()
+        hues = (np.arange(SCREEN_HEIGHT * 2) / SCREEN_HEIGHT) % 1
+        self.victory_background = gradient_surface(
+            np.trunc(hsv_to_rgb_array(hues, 0.7, 1) * 255), SCREEN_WIDTH
+        ).convert()
+        # Victory prompt layer, cleared and redrawn each frame
+        self.victory_prompt = pygame.Surface((500, 40), pygame.SRCALPHA)
+        self.victory_score_box = self.render_victory_score_box()
+        
+        # Menu text and panels never change; render them once
+        self.menu_title = self.render_menu_title()
+        self.game_over_title = self.render_game_over_title()
+        self.menu_subtitle = self.font.render("Modern Graphics Edition", True, GOLD)
+        self.menu_labels = [self.small_font.render(f"[{i+1}] World {i+1}: {theme.name}", True, WHITE)
+                            for i, theme in enumerate(self.world_themes)]
+        # World preview boxes, shared by the menu drawing and mouse selection
+        self.world_select_rects = [pygame.Rect(SCREEN_WIDTH // 2 - 250, 280 + i * 80, 500, 60)
+                                   for i in range(len(self.world_themes))]
+        self.menu_controls_panel = pygame.Surface((600, 40), pygame.SRCALPHA)
+        pygame.draw.rect(self.menu_controls_panel, (0, 0, 0, 100),
+                         self.menu_controls_panel.get_rect(), border_radius=10)
+        self.menu_controls = self.small_font.render("↑↓←→ Move | SPACE Jump | X Fire/Ice | SHIFT Run",
+                                                    True, WHITE)
+        self.high_score_text = (None, None)
+        
+        # HUD pieces; the background follows the world theme, the score text
+        # is re-rendered only when the score changes
+        self.hud_background = None
+        self.power_glow = None
+        self.power_border = None
+        # Pieces composited only into the HUD layer are kept premultiplied
+        self.hud_lives_label = render_text(32, "LIVES:", WHITE).premul_alpha()
+        self.heart_icon = self.render_heart_icon().premul_alpha()
+        self.trophy_icon = self.render_trophy_icon()
+        # Redrawn in place each frame as the coin spins
+        self.hud_coin_icon = pygame.Surface((30, 30), pygame.SRCALPHA).convert_alpha()
+        self.score_text = (None, None)
+        # Score, lives, coin count, world info and power-up border, composited
+        # again only when one of them changes
+        self.hud_layer = pygame.Surface((SCREEN_WIDTH, 100), pygame.SRCALPHA).convert_alpha()
+        self.hud_key = None
+    
+    @classmethod
+    def overlay_surface(cls, kind, color, size, radius=0):
+        # Translucent glow, shadow and highlight shapes, built once per shape
+        key = (kind, color, size, radius)
+        surf = cls._overlay_cache.get(key)
+        if surf is None:
+            surf = pygame.Surface(size, pygame.SRCALPHA)
+            if kind == "circle":
+                pygame.draw.circle(surf, color, (size[0] // 2, size[1] // 2), radius)
+            elif kind == "ellipse":
+                pygame.draw.ellipse(surf, color, surf.get_rect())
+            else:
+                pygame.draw.rect(surf, color, surf.get_rect())
+            cls._overlay_cache[key] = surf
+        return surf
+    
+    @classmethod
+    def trail_sprites(cls, is_ice, length):
+        sprites = cls._trail_atlas.get((is_ice, length))
+        if sprites is None:
+            color = (150, 200, 255) if is_ice else SUNSET_ORANGE
+            sprites = [cls.overlay_surface("circle", (*color, int(100 * (i / length))), (8, 8), 4 - i)
+                       for i in range(length)]
+            cls._trail_atlas[(is_ice, length)] = sprites
+        return sprites
+    
+    @classmethod
+    def ray_wheel(cls, degrees):
+        # The 12 rays repeat every 30 degrees, so 30 wheels cover a full turn
+        degrees %= 30
+        wheel = cls._ray_wheels.get(degrees)
+        if wheel is None:
+            wheel = pygame.Surface((600, 600), pygame.SRCALPHA)
+            phi = math.radians(degrees)
+            ca, sa = math.cos(phi), math.sin(phi)
+            ray_x = (RAY_COS * ca - RAY_SIN * sa).tolist()
+            ray_y = (RAY_SIN * ca + RAY_COS * sa).tolist()
+            for dx, dy in zip(ray_x, ray_y):
+                pygame.draw.line(wheel, (*GOLD, 50), (300 + dx * 100, 300 + dy * 100),
+                                 (300 + dx * 300, 300 + dy * 300), 3)
+            wheel = wheel.convert_alpha()
+            cls._ray_wheels[degrees] = wheel
+        return wheel
     
     def start_world(self, world_index):
         self.current_world_index = world_index
         theme = self.world_themes[world_index]
         self.world = World(world_index + 1, theme)
         self.player = Player(*self.world.spawn_point)
+        self.hud_background = self.render_hud_background(theme)
+        self.power_glow = self.render_power_glow(theme)
+        self.power_border = self.render_power_border(theme)
+        self.hud_key = None
         self.transition_alpha = 255
     
     def handle_collisions(self):
+        # Hot-loop names bound once; the player and world outlive this call, but
+        # player.rect is replaced whenever the character sprite is rebuilt
+        player = self.player
+        player_rect = player.rect
+        world = self.world
+        particles = world.particle_system
+        query_nearby = world.query_nearby
+        discard = world.discard
+        
         # Platform collisions with improved physics
-        self.player.on_ground = False
-        for platform in self.world.platforms:
-            if self.player.rect.colliderect(platform.rect):
-                if self.player.vy > 0:  # Falling
-                    self.player.rect.bottom = platform.rect.top
-                    self.player.vy = 0
-                    self.player.on_ground = True
+        player.on_ground = False
+        for platform in world.query(player_rect):
+            if player_rect.colliderect(platform.rect):
+                if player.vy > 0:  # Falling
+                    player_rect.bottom = platform.rect.top
+                    player.vy = 0
+                    player.on_ground = True
                     
                     # Create landing particles
-                    if not self.player.jump_particles_created:
-                        for _ in range(5):
-                            self.world.particle_system.add_particle(
-                                self.player.rect.centerx + random.randint(-10, 10),
-                                self.player.rect.bottom,
-                                random.uniform(-2, 2), random.uniform(-2, 0),
-                                self.world.theme.particle_color, 20, 2
-                            )
-                        self.player.jump_particles_created = True
+                    if not player.jump_particles_created:
+                        particles.add_particles(
+                            player_rect.centerx + np.random.randint(-10, 11, 5),
+                            player_rect.bottom,
+                            np.random.uniform(-2, 2, 5), np.random.uniform(-2, 0, 5),
+                            world.theme.particle_color, 20, 2
+                        )
+                        player.jump_particles_created = True
                     
                     # Move with platform
                     if platform.is_moving:
-                        self.player.rect.x += platform.move_speed * platform.direction
+                        player_rect.x += platform.move_speed * platform.direction
         
-        # Update platforms
-        for platform in self.world.platforms:
+        # Update platforms; static ones have nothing to do
+        for platform in world.moving_platforms:
             platform.update()
         
         # Enemy collisions
-        for enemy in self.world.enemies:
-            if not enemy.alive:
-                continue
-            
-            if self.player.rect.colliderect(enemy.rect):
-                if self.player.vy > 0 and self.player.rect.bottom < enemy.rect.centery:
+        for enemy in query_nearby(player_rect, AnimatedEnemy):
+            if player_rect.colliderect(enemy.rect):
+                if player.vy > 0 and player_rect.bottom < enemy.rect.centery:
                     # Stomp enemy
                     enemy.alive = False
                     enemy.squash_timer = 10
-                    self.world.particle_system.create_explosion(
+                    particles.create_explosion(
                         enemy.rect.centerx, enemy.rect.centery,
                         (255, 100, 0), 15
                     )
-                    self.world.enemies.remove(enemy)
+                    discard(enemy)
                     self.score += 100
-                    self.player.vy = JUMP_STRENGTH // 2
-                elif self.player.invincible_timer > 0:
+                    player.vy = JUMP_STRENGTH // 2
+                elif player.invincible_timer > 0:
                     enemy.alive = False
-                    self.world.particle_system.create_explosion(
+                    particles.create_explosion(
                         enemy.rect.centerx, enemy.rect.centery,
                         GOLD, 20
                     )
-                    self.world.enemies.remove(enemy)
+                    discard(enemy)
                     self.score += 200
                 else:
                     self.take_damage()
+                    player_rect = player.rect
         
         # Power-up collisions
-        for power_up in self.world.power_ups:
-            if not power_up.collected and self.player.rect.colliderect(power_up.rect):
+        for power_up in query_nearby(player_rect, AnimatedPowerUp):
+            if not power_up.collected and player_rect.colliderect(power_up.rect):
                 power_up.collected = True
-                self.world.particle_system.create_sparkle(
+                particles.create_sparkle(
                     power_up.rect.centerx, power_up.rect.centery,
                     power_up.get_glow_color()
                 )
-                self.world.power_ups.remove(power_up)
+                discard(power_up)
                 
                 if power_up.power_type == PowerUpType.STAR:
-                    self.player.invincible_timer = 600
+                    player.invincible_timer = 600
                 
-                self.player.power_up = power_up.power_type
-                self.player.create_character_sprite()
+                player.power_up = power_up.power_type
+                player.create_character_sprite()
+                player_rect = player.rect
                 self.score += 500
         
         # Coin collisions
-        for coin in self.world.coins:
-            if not coin.collected and self.player.rect.colliderect(coin.rect):
+        for coin in query_nearby(player_rect, AnimatedCoin):
+            if not coin.collected and player_rect.colliderect(coin.rect):
                 coin.collected = True
-                self.world.particle_system.create_sparkle(
+                particles.create_sparkle(
                     coin.rect.centerx, coin.rect.centery, GOLD
                 )
-                self.world.coins.remove(coin)
-                self.player.coins += 1
+                discard(coin)
+                player.coins += 1
                 self.score += 50
                 
-                if self.player.coins >= 100:
-                    self.player.coins = 0
-                    self.player.lives += 1
+                if player.coins >= 100:
+                    player.coins = 0
+                    player.lives += 1
         
         # Fireball collisions
-        for fireball in self.world.fireballs:
-            # Platform bouncing
-            for platform in self.world.platforms:
+        for fireball in world.fireballs:
+            # Platform bouncing, at most one bounce per frame
+            for platform in world.query(fireball.rect):
                 if fireball.rect.colliderect(platform.rect):
                     fireball.vy = -8
                     fireball.bounces += 1
-                    self.world.particle_system.create_sparkle(
+                    particles.create_sparkle(
                         fireball.rect.centerx, fireball.rect.centery,
                         (150, 200, 255) if fireball.is_ice else SUNSET_ORANGE
                     )
                     if fireball.bounces >= fireball.max_bounces:
-                        self.world.fireballs.remove(fireball)
-                        break
+                        world.recycle_fireball(fireball)
+                    break
+            
+            if fireball.removed:
+                continue
             
             # Enemy hits
-            for enemy in self.world.enemies:
+            for enemy in query_nearby(fireball.rect, AnimatedEnemy):
                 if enemy.alive and fireball.rect.colliderect(enemy.rect):
                     enemy.alive = False
                     
                     if fireball.is_ice:
                         # Freeze effect
-                        self.world.particle_system.create_explosion(
+                        particles.create_explosion(
                             enemy.rect.centerx, enemy.rect.centery,
                             (150, 200, 255), 25
                         )
                     else:
                         # Burn effect
-                        self.world.particle_system.create_explosion(
+                        particles.create_explosion(
                             enemy.rect.centerx, enemy.rect.centery,
                             SUNSET_ORANGE, 20
                         )
                     
-                    self.world.enemies.remove(enemy)
-                    if fireball in self.world.fireballs:
-                        self.world.fireballs.remove(fireball)
+                    discard(enemy)
+                    world.recycle_fireball(fireball)
                     self.score += 150
+                    break
         
         # Flag collision
-        if self.world.flag and self.player.rect.colliderect(self.world.flag.rect):
+        if world.flag and player_rect.colliderect(world.flag.rect):
             self.complete_level()
     
     def take_damage(self):
@@ -1132,12 +1788,11 @@ class Game:
         if self.player.fire_cooldown == 0:
             if self.player.power_up == PowerUpType.FIRE_FLOWER:
                 direction = 1 if self.player.facing_right else -1
-                fireball = Fireball(
+                fireball = self.world.spawn_fireball(
                     self.player.rect.centerx + direction * 20,
                     self.player.rect.centery,
                     direction, False
                 )
-                self.world.fireballs.add(fireball)
                 self.player.fire_cooldown = 20
                 
                 # Shooting particles
@@ -1147,12 +1802,11 @@ class Game:
                 
             elif self.player.power_up == PowerUpType.ICE_FLOWER:
                 direction = 1 if self.player.facing_right else -1
-                fireball = Fireball(
+                fireball = self.world.spawn_fireball(
                     self.player.rect.centerx + direction * 20,
                     self.player.rect.centery,
                     direction, True
                 )
-                self.world.fireballs.add(fireball)
                 self.player.fire_cooldown = 25
                 
                 # Ice particles
@@ -1168,40 +1822,52 @@ class Game:
         # Update player
         self.player.update()
         
+        particles = self.world.particle_system
+        
         # Create running particles
         if abs(self.player.vx) > MOVE_SPEED and self.player.on_ground and random.random() > 0.7:
-            self.world.particle_system.add_particle(
+            particles.add_particle(
                 self.player.rect.centerx - self.player.vx,
                 self.player.rect.bottom,
                 -self.player.vx * 0.2, -1,
                 self.world.theme.particle_color, 15, 2
             )
         
-        # Update world objects
-        for enemy in self.world.enemies:
-            enemy.update()
+        # Update world objects; off-screen coins and power-ups stay frozen
+        self.world.update_enemies()
         
-        for coin in self.world.coins:
-            coin.update()
+        for coin in self.world.in_view(self.world.coins_by_x):
+            if not coin.collected:
+                coin.update()
+                self.world.grid_move(coin)
         
-        for power_up in self.world.power_ups:
-            power_up.update()
+        for power_up in self.world.in_view(self.world.power_ups_by_x):
+            if not power_up.collected:
+                power_up.update()
+                self.world.grid_move(power_up)
         
-        for fireball in self.world.fireballs:
+        fireballs = self.world.fireballs.sprites()
+        for fireball in fireballs:
             fireball.update()
             
-            # Fireball trail
-            if random.random() > 0.3:
-                color = (150, 200, 255) if fireball.is_ice else SUNSET_ORANGE
-                self.world.particle_system.add_particle(
-                    fireball.rect.centerx, fireball.rect.centery,
-                    random.uniform(-1, 1), random.uniform(-1, 1),
-                    color, 10, 2, False
-                )
-            
             # Remove off-screen fireballs
             if fireball.rect.x < 0 or fireball.rect.x > self.world.level_width:
-                self.world.fireballs.remove(fireball)
+                self.world.recycle_fireball(fireball)
+        
+        # Fireball trail, with every fireball's random draws taken in one go
+        if fireballs:
+            emit = np.random.random(len(fireballs)) > 0.3
+            emitting = [fireball for fireball, e in zip(fireballs, emit) if e]
+            if emitting:
+                n = len(emitting)
+                centers = np.array([fireball.rect.center for fireball in emitting])
+                colors = np.array([(150, 200, 255) if fireball.is_ice else SUNSET_ORANGE
+                                   for fireball in emitting], dtype=np.uint8)
+                particles.add_particles(
+                    centers[:, 0], centers[:, 1],
+                    np.random.uniform(-1, 1, n), np.random.uniform(-1, 1, n),
+                    colors, 10, 2, False
+                )
         
         # Update clouds
         for cloud in self.world.clouds:
@@ -1214,6 +1880,7 @@ class Game:
         
         # Handle collisions
         self.handle_collisions()
+        self.world.sweep_removed()
         
         # Keep player in bounds
         self.player.rect.x = max(0, min(self.player.rect.x, self.world.level_width - self.player.rect.width))
@@ -1236,14 +1903,7 @@ class Game:
         )
         
         # Draw gradient
-        for i in range(SCREEN_HEIGHT):
-            progress = i / SCREEN_HEIGHT
-            color = (
-                135 + progress * 50,
-                206 - progress * 50,
-                250 - progress * 100
-            )
-            pygame.draw.line(self.screen, color, (0, i), (SCREEN_WIDTH, i))
+        self.screen.blit(self.menu_background, (0, 0))
         
         # Floating particles
         for _ in range(2):
@@ -1253,204 +1913,190 @@ class Game:
                 self.world_themes[0].bg_gradient
         
         # Title with glow effect
-        title_surf = pygame.Surface((600, 100), pygame.SRCALPHA)
-        
-        # Glow
-        for i in range(5):
-            glow_alpha = 100 - i * 20
-            glow_size = 48 + i * 4
-            title_text = pygame.font.Font(None, glow_size).render("SUPER MARIO BROS 2D", True, 
-                                                                  (*GOLD, glow_alpha))
-            title_rect = title_text.get_rect(center=(300, 50))
-            title_surf.blit(title_text, title_rect)
-        
-        # Main title
-        title_text = self.font.render("SUPER MARIO BROS 2D", True, WHITE)
-        title_rect = title_text.get_rect(center=(300, 50))
-        title_surf.blit(title_text, title_rect)
-        
-        self.screen.blit(title_surf, (SCREEN_WIDTH // 2 - 300, 80))
+        self.screen.blit(self.menu_title, (SCREEN_WIDTH // 2 - 300, 80))
         
         # Subtitle
-        subtitle_text = self.font.render("Modern Graphics Edition", True, GOLD)
-        subtitle_rect = subtitle_text.get_rect(center=(SCREEN_WIDTH // 2, 200))
-        self.screen.blit(subtitle_text, subtitle_rect)
+        subtitle_rect = self.menu_subtitle.get_rect(center=(SCREEN_WIDTH // 2, 200))
+        self.screen.blit(self.menu_subtitle, subtitle_rect)
         
         # World selection with preview boxes
+        mouse_pos = pygame.mouse.get_pos()
         for i, theme in enumerate(self.world_themes):
-            y = 300 + i * 80
-            
             # Preview box
-            preview_rect = pygame.Rect(SCREEN_WIDTH // 2 - 250, y - 20, 500, 60)
+            preview_rect = self.world_select_rects[i]
             
-            # Gradient background for each world
-            for j in range(60):
-                progress = j / 60
-                if len(theme.bg_gradient) > 1:
-                    color = tuple(int(theme.bg_gradient[0][k] * (1 - progress) + 
-                                    theme.bg_gradient[1][k] * progress) for k in range(3))
-                else:
-                    color = theme.bg_gradient[0]
-                pygame.draw.line(self.screen, color, 
-                               (preview_rect.left, preview_rect.top + j),
-                               (preview_rect.right, preview_rect.top + j))
-            
-            # Border
-            pygame.draw.rect(self.screen, theme.accent_color, preview_rect, 3)
+            # Gradient background and border for each world, rebuilt only when
+            # its colors change
+            stops = tuple(tuple(int(c) for c in color) for color in theme.bg_gradient[:2])
+            cached = self.preview_gradients.get(i)
+            if cached is None or cached[0] != stops:
+                cached = (stops, self.render_preview(stops, theme.accent_color))
+                self.preview_gradients[i] = cached
+            self.screen.blit(cached[1], preview_rect.topleft)
             
             # Hover effect
-            if preview_rect.collidepoint(pygame.mouse.get_pos()):
-                hover_surf = pygame.Surface((500, 60), pygame.SRCALPHA)
-                pygame.draw.rect(hover_surf, (*theme.accent_color, 50), hover_surf.get_rect())
+            if preview_rect.collidepoint(mouse_pos):
+                hover_surf = self.overlay_surface("rect", (*theme.accent_color, 50), (500, 60))
                 self.screen.blit(hover_surf, preview_rect)
                 
                 # Pulsing border
                 pulse = abs(math.sin(self.menu_animation * 0.1))
                 pygame.draw.rect(self.screen, 
-                               tuple(int(c + (255 - c) * pulse) for c in theme.accent_color),
+                               blend_colors(WHITE, theme.accent_color, int(pulse * 256)),
                                preview_rect.inflate(4, 4), 3)
             
             # World text
-            world_text = self.small_font.render(f"[{i+1}] World {i+1}: {theme.name}", True, WHITE)
-            world_rect = world_text.get_rect(center=(SCREEN_WIDTH // 2, y + 10))
+            world_text = self.menu_labels[i]
+            world_rect = world_text.get_rect(center=preview_rect.center)
             self.screen.blit(world_text, world_rect)
         
         # Controls
-        controls_surf = pygame.Surface((600, 40), pygame.SRCALPHA)
-        pygame.draw.rect(controls_surf, (0, 0, 0, 100), controls_surf.get_rect(), border_radius=10)
-        self.screen.blit(controls_surf, (SCREEN_WIDTH // 2 - 300, 680))
+        self.screen.blit(self.menu_controls_panel, (SCREEN_WIDTH // 2 - 300, 680))
         
-        controls_text = self.small_font.render("↑↓←→ Move | SPACE Jump | X Fire/Ice | SHIFT Run", True, WHITE)
-        controls_rect = controls_text.get_rect(center=(SCREEN_WIDTH // 2, 700))
-        self.screen.blit(controls_text, controls_rect)
+        controls_rect = self.menu_controls.get_rect(center=(SCREEN_WIDTH // 2, 700))
+        self.screen.blit(self.menu_controls, controls_rect)
         
-        # High score with glow
+        # High score with glow, re-rendered only when the score changes
         if self.high_score > 0:
-            high_score_text = self.small_font.render(f"High Score: {self.high_score:,}", True, GOLD)
+            if self.high_score_text[0] != self.high_score:
+                self.high_score_text = (self.high_score,
+                                        self.small_font.render(f"High Score: {self.high_score:,}", True, GOLD))
+            high_score_text = self.high_score_text[1]
             high_score_rect = high_score_text.get_rect(center=(SCREEN_WIDTH // 2, 750))
             
             # Glow effect
             for i in range(3):
-                glow_surf = pygame.Surface((300, 40), pygame.SRCALPHA)
-                pygame.draw.ellipse(glow_surf, (*GOLD, 30 - i * 10), glow_surf.get_rect())
+                glow_surf = self.overlay_surface("ellipse", (*GOLD, 30 - i * 10), (300, 40))
                 self.screen.blit(glow_surf, (high_score_rect.left - 50, high_score_rect.top - 5))
             
             self.screen.blit(high_score_text, high_score_rect)
     
+    def render_menu_title(self):
+        title_surf = pygame.Surface((600, 100), pygame.SRCALPHA)
+        
+        # Glow
+        for i in range(5):
+            glow_alpha = 100 - i * 20
+            glow_size = 48 + i * 4
+            title_text = get_font(glow_size).render("SUPER MARIO BROS 2D", True,
+                                                    (*GOLD, glow_alpha))
+            title_rect = title_text.get_rect(center=(300, 50))
+            title_surf.blit(title_text, title_rect)
+        
+        # Main title
+        title_text = self.font.render("SUPER MARIO BROS 2D", True, WHITE)
+        title_rect = title_text.get_rect(center=(300, 50))
+        title_surf.blit(title_text, title_rect)
+        
+        return title_surf.convert_alpha(self.screen)
+    
+    def render_preview(self, stops, accent_color):
+        # 500x60 world preview box; one column wider to match the inclusive
+        # end point of the scanlines it replaced
+        progress = np.arange(60)[:, None] / 60
+        if len(stops) > 1:
+            rows = np.trunc(np.asarray(stops[0], dtype=np.float64) * (1 - progress) +
+                            np.asarray(stops[1], dtype=np.float64) * progress)
+        else:
+            rows = np.broadcast_to(np.asarray(stops[0]), (60, 3))
+        preview = gradient_surface(rows, 501).convert()
+        pygame.draw.rect(preview, accent_color, (0, 0, 500, 60), 3)
+        return preview
+    
     def render_game(self):
         # Draw gradient background
         self.world.draw_gradient_background(self.screen)
         
         # Draw parallax background objects
-        for obj in self.world.background_objects:
-            draw_x = obj['x'] - self.world.camera_x * obj['layer']
-            if -obj['width'] < draw_x < SCREEN_WIDTH:
-                # Mountain/hill shape
-                points = [
-                    (draw_x, obj['y'] + obj['height']),
-                    (draw_x + obj['width'] // 4, obj['y']),
-                    (draw_x + obj['width'] * 3 // 4, obj['y'] + obj['height'] // 3),
-                    (draw_x + obj['width'], obj['y'] + obj['height'])
-                ]
-                pygame.draw.polygon(self.screen, obj['color'], points)
+        self.world.draw_parallax(self.screen)
         
         # Draw clouds
-        for cloud in self.world.clouds:
-            cloud.draw(self.screen, self.world.camera_x)
-        
-        # Draw shadows for all objects
-        shadow_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self.world.draw_clouds(self.screen)
         
+        # Draw shadows for all objects; BLEND_RGBA_MAX keeps overlaps at one shade
+        cx = self.world.camera_x_int
+        shadow_surf = self.world.shadow_surf
+        shadow_surf.fill((0, 0, 0, 0))
+        shadow_list = []
         for platform in self.world.platforms:
-            adjusted_rect = platform.rect.copy()
-            adjusted_rect.x -= self.world.camera_x
-            if -platform.rect.width < adjusted_rect.x < SCREEN_WIDTH:
-                shadow_rect = adjusted_rect.copy()
-                shadow_rect.y += 5
-                pygame.draw.rect(shadow_surf, (0, 0, 0, 50), shadow_rect)
+            dx = platform.rect.x - cx
+            if -platform.rect.width < dx < SCREEN_WIDTH:
+                tile = self.overlay_surface("rect", (0, 0, 0, 50), platform.rect.size)
+                shadow_list.append((tile, (dx, platform.rect.y + 5)))
+        batch_blit(shadow_surf, shadow_list, pygame.BLEND_RGBA_MAX)
         
         self.screen.blit(shadow_surf, (0, 0))
         
-        # Draw world objects
+        # Draw world objects, batched into one blits call in draw order
+        blit_list = []
         for platform in self.world.platforms:
-            adjusted_rect = platform.rect.copy()
-            adjusted_rect.x -= self.world.camera_x
-            if -platform.rect.width < adjusted_rect.x < SCREEN_WIDTH:
-                self.screen.blit(platform.image, adjusted_rect)
+            dx = platform.rect.x - cx
+            if -platform.rect.width < dx < SCREEN_WIDTH:
+                blit_list.append((platform.image, (dx, platform.rect.y)))
         
         # Draw collectibles with glow
+        coin_glow = self.overlay_surface("circle", (*GOLD, 30), (48, 48), 20)
         for coin in self.world.coins:
-            if not coin.collected:
-                adjusted_rect = coin.rect.copy()
-                adjusted_rect.x -= self.world.camera_x
-                if -coin.rect.width < adjusted_rect.x < SCREEN_WIDTH:
-                    # Glow
-                    glow_surf = pygame.Surface((48, 48), pygame.SRCALPHA)
-                    pygame.draw.circle(glow_surf, (*GOLD, 30), (24, 24), 20)
-                    self.screen.blit(glow_surf, (adjusted_rect.x - 12, adjusted_rect.y - 12))
-                    # Coin
-                    self.screen.blit(coin.image, adjusted_rect)
+            dx = coin.rect.x - cx
+            if -coin.rect.width < dx < SCREEN_WIDTH:
+                # Glow
+                blit_list.append((coin_glow, (dx - 12, coin.rect.y - 12)))
+                # Coin
+                blit_list.append((coin.image, (dx, coin.rect.y)))
         
         for power_up in self.world.power_ups:
-            if not power_up.collected:
-                adjusted_rect = power_up.rect.copy()
-                adjusted_rect.x -= self.world.camera_x
-                if -power_up.rect.width < adjusted_rect.x < SCREEN_WIDTH:
-                    self.screen.blit(power_up.image, adjusted_rect)
+            dx = power_up.rect.x - cx
+            if -power_up.rect.width < dx < SCREEN_WIDTH:
+                blit_list.append((power_up.image, (dx, power_up.rect.y)))
         
         # Draw enemies
         for enemy in self.world.enemies:
-            if enemy.alive:
-                adjusted_rect = enemy.rect.copy()
-                adjusted_rect.x -= self.world.camera_x
-                if -enemy.rect.width < adjusted_rect.x < SCREEN_WIDTH:
-                    self.screen.blit(enemy.image, adjusted_rect)
+            dx = enemy.rect.x - cx
+            if -enemy.rect.width < dx < SCREEN_WIDTH:
+                blit_list.append((enemy.image, (dx, enemy.rect.y)))
         
         # Draw fireballs with trail
         for fireball in self.world.fireballs:
             # Draw trail
-            for i, pos in enumerate(fireball.trail_positions):
-                alpha = 100 * (i / len(fireball.trail_positions))
-                trail_surf = pygame.Surface((8, 8), pygame.SRCALPHA)
-                color = (150, 200, 255) if fireball.is_ice else SUNSET_ORANGE
-                pygame.draw.circle(trail_surf, (*color, int(alpha)), (4, 4), 4 - i)
-                self.screen.blit(trail_surf, (pos[0] - self.world.camera_x - 4, pos[1] - 4))
+            trail = fireball.trail_positions
+            if trail:
+                for trail_surf, (px, py) in zip(self.trail_sprites(fireball.is_ice, len(trail)), trail):
+                    blit_list.append((trail_surf, (px - cx - 4, py - 4)))
             
             # Draw fireball
-            adjusted_rect = fireball.rect.copy()
-            adjusted_rect.x -= self.world.camera_x
-            if -fireball.rect.width < adjusted_rect.x < SCREEN_WIDTH:
-                self.screen.blit(fireball.image, adjusted_rect)
+            dx = fireball.rect.x - cx
+            if -fireball.rect.width < dx < SCREEN_WIDTH:
+                blit_list.append((fireball.image, (dx, fireball.rect.y)))
+        
+        batch_blit(self.screen, blit_list)
         
         # Draw flag with glow
-        if self.world.flag:
-            adjusted_rect = self.world.flag.rect.copy()
-            adjusted_rect.x -= self.world.camera_x
-            if -self.world.flag.rect.width < adjusted_rect.x < SCREEN_WIDTH:
+        flag = self.world.flag
+        if flag:
+            dx = flag.rect.x - cx
+            if -flag.rect.width < dx < SCREEN_WIDTH:
                 # Pulsing glow
-                glow_size = 40 + math.sin(pygame.time.get_ticks() * 0.005) * 10
-                glow_surf = pygame.Surface((int(glow_size * 2), int(glow_size * 2)), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surf, (*self.world.theme.accent_color, 50), 
-                                 (int(glow_size), int(glow_size)), int(glow_size))
+                glow_size = 40 + fsin(self.frame_time * 0.005) * 10
+                glow_surf = self.overlay_surface("circle", (*self.world.theme.accent_color, 50),
+                                                 (int(glow_size * 2), int(glow_size * 2)), int(glow_size))
                 self.screen.blit(glow_surf, 
-                               (adjusted_rect.centerx - glow_size, adjusted_rect.centery - glow_size))
-                self.screen.blit(self.world.flag.image, adjusted_rect)
+                               (dx + flag.rect.width // 2 - glow_size, flag.rect.centery - glow_size))
+                self.screen.blit(flag.image, (dx, flag.rect.y))
         
         # Draw player
-        adjusted_rect = self.player.rect.copy()
-        adjusted_rect.x -= self.world.camera_x
+        player_rect = self.player.rect
+        dx = player_rect.x - cx
         
         # Player shadow
-        shadow_surf = pygame.Surface((self.player.rect.width + 10, 10), pygame.SRCALPHA)
-        pygame.draw.ellipse(shadow_surf, (0, 0, 0, 50), shadow_surf.get_rect())
-        self.screen.blit(shadow_surf, (adjusted_rect.x - 5, adjusted_rect.bottom - 5))
+        shadow_surf = self.overlay_surface("ellipse", (0, 0, 0, 50), (player_rect.width + 10, 10))
+        self.screen.blit(shadow_surf, (dx - 5, player_rect.bottom - 5))
         
         # Draw player with flashing
         if self.player.invincible_timer == 0 or self.player.invincible_timer % 10 < 5:
-            self.screen.blit(self.player.image, adjusted_rect)
+            self.screen.blit(self.player.image, (dx, player_rect.y))
         
         # Draw particles
-        self.world.particle_system.draw(self.screen, self.world.camera_x)
+        self.world.particle_system.draw(self.screen, self.world.camera_x_int)
         
         # Draw HUD
         self.render_hud()
@@ -1461,34 +2107,96 @@ class Game:
             transition_surf.fill((255, 255, 255, self.transition_alpha))
             self.screen.blit(transition_surf, (0, 0))
     
-    def render_hud(self):
-        # HUD background
+    def render_hud_background(self, theme):
         hud_surf = pygame.Surface((SCREEN_WIDTH, 100), pygame.SRCALPHA)
         pygame.draw.rect(hud_surf, (0, 0, 0, 100), hud_surf.get_rect())
-        pygame.draw.line(hud_surf, (*self.world.theme.accent_color, 200), 
+        pygame.draw.line(hud_surf, (*theme.accent_color, 200), 
                         (0, 99), (SCREEN_WIDTH, 99), 2)
-        self.screen.blit(hud_surf, (0, 0))
+        # Premultiplied for the HUD layer
+        return hud_surf.convert_alpha(self.screen).premul_alpha()
+    
+    def render_power_glow(self, theme):
+        # The three stacked glow layers (alpha 30, 20, 10) share one shape and
+        # color, so they flatten into a single layer of the combined coverage
+        coverage = 1 - (1 - 30 / 255) * (1 - 20 / 255) * (1 - 10 / 255)
+        glow_surf = pygame.Surface((140, 70), pygame.SRCALPHA)
+        pygame.draw.rect(glow_surf, (*theme.accent_color, round(coverage * 255)), 
+                       glow_surf.get_rect(), border_radius=10)
+        return glow_surf.convert_alpha(self.screen)
+    
+    def render_power_border(self, theme):
+        border_surf = pygame.Surface((120, 60), pygame.SRCALPHA)
+        pygame.draw.rect(border_surf, theme.accent_color, border_surf.get_rect(), 3)
+        # Premultiplied for the HUD layer
+        return border_surf.convert_alpha(self.screen).premul_alpha()
+    
+    def render_trophy_icon(self):
+        trophy_surf = pygame.Surface((60, 60), pygame.SRCALPHA)
+        # Draw trophy shape
+        pygame.draw.ellipse(trophy_surf, GOLD, (10, 10, 40, 30))
+        pygame.draw.rect(trophy_surf, GOLD, (25, 35, 10, 15))
+        pygame.draw.rect(trophy_surf, GOLD, (15, 45, 30, 10))
+        return trophy_surf.convert_alpha(self.screen)
+    
+    def render_heart_icon(self):
+        # Draw heart shape
+        heart_surf = pygame.Surface((30, 30), pygame.SRCALPHA)
+        pygame.draw.circle(heart_surf, BRIGHT_RED, (10, 12), 6)
+        pygame.draw.circle(heart_surf, BRIGHT_RED, (20, 12), 6)
+        points = [(5, 16), (15, 26), (25, 16)]
+        pygame.draw.polygon(heart_surf, BRIGHT_RED, points)
+        return heart_surf.convert_alpha(self.screen)
+    
+    def render_hud_layer(self):
+        hud_layer = self.hud_layer
+        hud_layer.fill((0, 0, 0, 0))
+        
+        # HUD background; pieces are collected in draw order for one batched blit
+        hud_list = [(self.hud_background, (0, 0))]
         
         # Score with style
-        score_text = self.small_font.render(f"SCORE: {self.score:,}", True, WHITE)
-        self.screen.blit(score_text, (20, 15))
+        if self.score_text[0] != self.score:
+            self.score_text = (self.score, self.small_font.render(f"SCORE: {self.score:,}", True, WHITE)
+                               .convert_alpha().premul_alpha())
+        hud_list.append((self.score_text[1], (20, 15)))
         
         # Lives with heart icons
-        lives_text = self.small_font.render("LIVES:", True, WHITE)
-        self.screen.blit(lives_text, (20, 45))
-        for i in range(self.player.lives):
-            heart_x = 120 + i * 35
-            # Draw heart shape
-            heart_surf = pygame.Surface((30, 30), pygame.SRCALPHA)
-            pygame.draw.circle(heart_surf, BRIGHT_RED, (10, 12), 6)
-            pygame.draw.circle(heart_surf, BRIGHT_RED, (20, 12), 6)
-            points = [(5, 16), (15, 26), (25, 16)]
-            pygame.draw.polygon(heart_surf, BRIGHT_RED, points)
-            self.screen.blit(heart_surf, (heart_x, 42))
+        hud_list.append((self.hud_lives_label, (20, 45)))
+        hud_list.extend((self.heart_icon, (120 + i * 35, 42)) for i in range(self.player.lives))
+        
+        # Coin count; the spinning icon is drawn per frame
+        hud_list.append((render_text(32, f"× {self.player.coins}", WHITE).premul_alpha(), (285, 45)))
+        
+        # World info
+        hud_list.append((render_text(32, f"WORLD {self.current_world_index + 1}", WHITE).premul_alpha(),
+                         (SCREEN_WIDTH - 200, 15)))
+        hud_list.append((render_text(32, self.world.theme.name.upper(), self.world.theme.accent_color)
+                         .premul_alpha(), (SCREEN_WIDTH - 200, 45)))
+        
+        # Power-up indicator border
+        if self.player.power_up != PowerUpType.NONE:
+            hud_list.append((self.power_border, (SCREEN_WIDTH // 2 - 60, 20)))
+        
+        # Every piece is premultiplied (the static ones when they are built), so
+        # translucent pieces stacked on the layer blend onto the screen exactly
+        # as if blitted one by one; pieces wholly off the layer (hearts past the
+        # right edge) are skipped
+        layer_rect = hud_layer.get_rect()
+        batch_blit(hud_layer, [(surf, pos) for surf, pos in hud_list
+                               if layer_rect.colliderect(surf.get_rect(topleft=pos))],
+                   pygame.BLEND_PREMULTIPLIED)
+    
+    def render_hud(self):
+        player = self.player
+        hud_key = (self.score, player.lives, player.coins, self.current_world_index, player.power_up)
+        if self.hud_key != hud_key:
+            self.hud_key = hud_key
+            self.render_hud_layer()
         
         # Coins with spinning icon
-        coin_icon = pygame.Surface((30, 30), pygame.SRCALPHA)
-        coin_scale = abs(math.cos(pygame.time.get_ticks() * 0.005))
+        coin_icon = self.hud_coin_icon
+        coin_icon.fill((0, 0, 0, 0))
+        coin_scale = abs(fcos(self.frame_time * 0.005))
         if coin_scale < 0.1:
             coin_scale = 0.1
         coin_width = int(20 * coin_scale)
@@ -1496,23 +2204,10 @@ class Game:
         if coin_scale > 0.3:
             pygame.draw.ellipse(coin_icon, (255, 245, 100), (15 - coin_width // 2 + 2, 7, coin_width - 4, 16))
         
-        self.screen.blit(coin_icon, (250, 40))
-        coins_text = self.small_font.render(f"× {self.player.coins}", True, WHITE)
-        self.screen.blit(coins_text, (285, 45))
-        
-        # World info
-        world_text = self.small_font.render(f"WORLD {self.current_world_index + 1}", True, WHITE)
-        self.screen.blit(world_text, (SCREEN_WIDTH - 200, 15))
-        
-        world_name = self.small_font.render(self.world.theme.name.upper(), True, 
-                                           self.world.theme.accent_color)
-        self.screen.blit(world_name, (SCREEN_WIDTH - 200, 45))
+        hud_list = [(coin_icon, (250, 40))]
         
         # Power-up indicator with icon
-        if self.player.power_up != PowerUpType.NONE:
-            power_rect = pygame.Rect(SCREEN_WIDTH // 2 - 60, 20, 120, 60)
-            pygame.draw.rect(self.screen, self.world.theme.accent_color, power_rect, 3)
-            
+        if player.power_up != PowerUpType.NONE:
             power_names = {
                 PowerUpType.MUSHROOM: "SUPER",
                 PowerUpType.FIRE_FLOWER: "FIRE",
@@ -1520,77 +2215,92 @@ class Game:
                 PowerUpType.ICE_FLOWER: "ICE"
             }
             
-            power_text = self.small_font.render(power_names[self.player.power_up], True, WHITE)
+            power_text = render_text(32, power_names[player.power_up], WHITE)
             power_text_rect = power_text.get_rect(center=(SCREEN_WIDTH // 2, 50))
             
             # Glow effect for power-up text
-            for i in range(3):
-                glow_surf = pygame.Surface((140, 70), pygame.SRCALPHA)
-                glow_alpha = 30 - i * 10
-                pygame.draw.rect(glow_surf, (*self.world.theme.accent_color, glow_alpha), 
-                               glow_surf.get_rect(), border_radius=10)
-                self.screen.blit(glow_surf, (SCREEN_WIDTH // 2 - 70, 15))
-            
-            self.screen.blit(power_text, power_text_rect)
-    
-    def render_game_over(self):
-        # Dark gradient background
-        for i in range(SCREEN_HEIGHT):
-            progress = i / SCREEN_HEIGHT
-            color = (50 - progress * 50, 0, 0)
-            pygame.draw.line(self.screen, color, (0, i), (SCREEN_WIDTH, i))
+            hud_list.append((self.power_glow, (SCREEN_WIDTH // 2 - 70, 15)))
+            hud_list.append((power_text, power_text_rect.topleft))
         
-        # Falling particles
-        if random.random() > 0.9:
-            x = random.randint(0, SCREEN_WIDTH)
-            # Particles would be managed by a persistent particle system
-        
-        # Game Over text with dramatic effect
+        self.screen.blit(self.hud_layer, (0, 0), special_flags=pygame.BLEND_PREMULTIPLIED)
+        batch_blit(self.screen, hud_list)
+    
+    def render_game_over_title(self):
         game_over_surf = pygame.Surface((600, 150), pygame.SRCALPHA)
         
         # Red glow
         for i in range(10):
             glow_alpha = 100 - i * 10
-            glow_text = pygame.font.Font(None, 72 + i * 2).render("GAME OVER", True, 
-                                                                 (255, 0, 0, glow_alpha))
+            glow_text = get_font(72 + i * 2).render("GAME OVER", True,
+                                                    (255, 0, 0, glow_alpha))
             glow_rect = glow_text.get_rect(center=(300, 75))
             game_over_surf.blit(glow_text, glow_rect)
         
         # Main text
-        game_over_text = pygame.font.Font(None, 72).render("GAME OVER", True, WHITE)
+        game_over_text = render_text(72, "GAME OVER", WHITE)
         game_over_rect = game_over_text.get_rect(center=(300, 75))
         game_over_surf.blit(game_over_text, game_over_rect)
         
-        self.screen.blit(game_over_surf, (SCREEN_WIDTH // 2 - 300, 200))
+        return game_over_surf.convert_alpha()
+    
+    def render_game_over(self, full_redraw=True):
+        # Only the pulsing record text and the blinking prompt change after the
+        # screen is first drawn; returns their rects, or None after a full redraw
+        background = self.game_over_background
+        
+        if full_redraw:
+            # Dark gradient background
+            self.screen.blit(background, (0, 0))
+            
+            # Game Over text with dramatic effect
+            self.screen.blit(self.game_over_title, (SCREEN_WIDTH // 2 - 300, 200))
+            
+            # Score display
+            score_text = render_text(48, f"Final Score: {self.score:,}", WHITE)
+            score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, 400))
+            self.screen.blit(score_text, score_rect)
         
-        # Score display
-        score_text = self.font.render(f"Final Score: {self.score:,}", True, WHITE)
-        score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, 400))
-        self.screen.blit(score_text, score_rect)
+        # Falling particles
+        if random.random() > 0.9:
+            x = random.randint(0, SCREEN_WIDTH)
+            # Particles would be managed by a persistent particle system
+        
+        dirty_rects = []
         
         if self.score >= self.high_score:
-            # New high score animation
-            pulse = abs(math.sin(pygame.time.get_ticks() * 0.005))
-            high_color = tuple(int(255 * pulse + c * (1 - pulse)) for c in GOLD)
-            new_high_text = self.font.render("NEW HIGH SCORE!", True, high_color)
-            new_high_rect = new_high_text.get_rect(center=(SCREEN_WIDTH // 2, 480))
-            self.screen.blit(new_high_text, new_high_rect)
+            # New high score animation, redrawn only when the blend step moves
+            pulse_index = int(abs(fsin(self.frame_time * 0.005)) * 256)
+            if full_redraw or pulse_index != self.high_pulse_index:
+                self.high_pulse_index = pulse_index
+                high_color = blend_colors(WHITE, GOLD, pulse_index)
+                new_high_text = render_text(48, "NEW HIGH SCORE!", high_color)
+                new_high_rect = new_high_text.get_rect(center=(SCREEN_WIDTH // 2, 480))
+                self.screen.blit(background, new_high_rect, new_high_rect)
+                self.screen.blit(new_high_text, new_high_rect)
+                dirty_rects.append(new_high_rect)
         
         # Continue prompt
-        continue_text = self.small_font.render("Press SPACE to return to menu", True, WHITE)
+        continue_text = render_text(32, "Press SPACE to return to menu", WHITE)
         continue_rect = continue_text.get_rect(center=(SCREEN_WIDTH // 2, 600))
+        self.screen.blit(background, continue_rect, continue_rect)
+        dirty_rects.append(continue_rect)
         
         # Blinking effect
-        if pygame.time.get_ticks() % 1000 < 700:
+        if self.frame_time % 1000 < 700:
             self.screen.blit(continue_text, continue_rect)
+        
+        return None if full_redraw else dirty_rects
+    
+    def render_victory_score_box(self):
+        score_surf = pygame.Surface((600, 100), pygame.SRCALPHA)
+        pygame.draw.rect(score_surf, (0, 0, 0, 100), score_surf.get_rect(), border_radius=20)
+        pygame.draw.rect(score_surf, GOLD, score_surf.get_rect(), 3, border_radius=20)
+        return score_surf.convert_alpha(self.screen)
     
     def render_victory(self):
-        # Rainbow gradient background
-        for i in range(SCREEN_HEIGHT):
-            hue = (i / SCREEN_HEIGHT + pygame.time.get_ticks() * 0.0001) % 1
-            rgb = colorsys.hsv_to_rgb(hue, 0.7, 1)
-            color = tuple(int(c * 255) for c in rgb)
-            pygame.draw.line(self.screen, color, (0, i), (SCREEN_WIDTH, i))
+        # Rainbow gradient background, scrolled one hue cycle per 10 seconds
+        scroll = int((self.frame_time * 0.0001) % 1 * SCREEN_HEIGHT)
+        self.screen.blit(self.victory_background, (0, 0), (0, scroll, SCREEN_WIDTH, SCREEN_HEIGHT))
         
         # Fireworks effect (simplified)
         if random.random() > 0.95:
@@ -1598,94 +2308,82 @@ class Game:
             y = random.randint(100, 300)
             # Create burst of particles
         
-        # Victory text with golden glow
-        victory_surf = pygame.Surface((800, 200), pygame.SRCALPHA)
-        
-        # Golden rays
-        for i in range(12):
-            angle = i * 30 + pygame.time.get_ticks() * 0.1
-            x1 = 400 + math.cos(math.radians(angle)) * 100
-            y1 = 100 + math.sin(math.radians(angle)) * 100
-            x2 = 400 + math.cos(math.radians(angle)) * 300
-            y2 = 100 + math.sin(math.radians(angle)) * 300
-            pygame.draw.line(victory_surf, (*GOLD, 50), (x1, y1), (x2, y2), 3)
+        # Golden rays around the victory text, clipped to the 200px banner band
+        wheel = self.ray_wheel(int(self.frame_time * 0.1))
+        self.screen.blit(wheel, (SCREEN_WIDTH // 2 - 300, 100), (0, 200, 600, 200))
         
         # Main text
-        victory_text = pygame.font.Font(None, 96).render("VICTORY!", True, GOLD)
-        victory_rect = victory_text.get_rect(center=(400, 100))
-        victory_surf.blit(victory_text, victory_rect)
-        
-        self.screen.blit(victory_surf, (SCREEN_WIDTH // 2 - 400, 100))
+        victory_text = render_text(96, "VICTORY!", GOLD)
+        victory_rect = victory_text.get_rect(center=(SCREEN_WIDTH // 2, 200))
+        self.screen.blit(victory_text, victory_rect)
         
         # Completion message
-        complete_text = self.font.render("All 5 Worlds Completed!", True, WHITE)
+        complete_text = render_text(48, "All 5 Worlds Completed!", WHITE)
         complete_rect = complete_text.get_rect(center=(SCREEN_WIDTH // 2, 300))
         self.screen.blit(complete_text, complete_rect)
         
         # Score with celebration
-        score_surf = pygame.Surface((600, 100), pygame.SRCALPHA)
-        pygame.draw.rect(score_surf, (0, 0, 0, 100), score_surf.get_rect(), border_radius=20)
-        pygame.draw.rect(score_surf, GOLD, score_surf.get_rect(), 3, border_radius=20)
-        self.screen.blit(score_surf, (SCREEN_WIDTH // 2 - 300, 380))
+        self.screen.blit(self.victory_score_box, (SCREEN_WIDTH // 2 - 300, 380))
         
-        score_text = self.font.render(f"Final Score: {self.score:,}", True, WHITE)
+        score_text = render_text(48, f"Final Score: {self.score:,}", WHITE)
         score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, 430))
         self.screen.blit(score_text, score_rect)
         
         if self.score >= self.high_score:
             # Trophy icon
-            trophy_surf = pygame.Surface((60, 60), pygame.SRCALPHA)
-            # Draw trophy shape
-            pygame.draw.ellipse(trophy_surf, GOLD, (10, 10, 40, 30))
-            pygame.draw.rect(trophy_surf, GOLD, (25, 35, 10, 15))
-            pygame.draw.rect(trophy_surf, GOLD, (15, 45, 30, 10))
-            self.screen.blit(trophy_surf, (SCREEN_WIDTH // 2 - 30, 500))
+            self.screen.blit(self.trophy_icon, (SCREEN_WIDTH // 2 - 30, 500))
             
-            new_record_text = self.small_font.render("NEW RECORD!", True, GOLD)
+            new_record_text = render_text(32, "NEW RECORD!", GOLD)
             new_record_rect = new_record_text.get_rect(center=(SCREEN_WIDTH // 2, 580))
             self.screen.blit(new_record_text, new_record_rect)
         
         # Continue prompt with animation
-        continue_alpha = 128 + 127 * math.sin(pygame.time.get_ticks() * 0.003)
-        continue_surf = pygame.Surface((500, 40), pygame.SRCALPHA)
-        continue_text = self.small_font.render("Press SPACE to return to menu", True, 
-                                              (*WHITE, int(continue_alpha)))
+        continue_alpha = 128 + 127 * fsin(self.frame_time * 0.003)
+        continue_surf = self.victory_prompt
+        continue_surf.fill((0, 0, 0, 0))
+        continue_text = render_text(32, "Press SPACE to return to menu", (*WHITE, int(continue_alpha)))
         continue_rect = continue_text.get_rect(center=(250, 20))
         continue_surf.blit(continue_text, continue_rect)
         self.screen.blit(continue_surf, (SCREEN_WIDTH // 2 - 250, 650))
     
     def render(self):
+        # One clock read per frame keeps every animated element in step
+        self.frame_time = pygame.time.get_ticks()
+        dirty_rects = None
+        
         if self.game_state == "MENU":
             self.render_menu()
         elif self.game_state == "PLAYING":
             self.render_game()
         elif self.game_state == "GAME_OVER":
-            self.render_game_over()
+            # Full redraw on entering the state, then only the animated rects
+            dirty_rects = self.render_game_over(self.drawn_state != "GAME_OVER")
         elif self.game_state == "VICTORY":
             self.render_victory()
         
-        pygame.display.flip()
+        self.drawn_state = self.game_state
+        if dirty_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects)
     
     def handle_input(self):
         keys = pygame.key.get_pressed()
         
+        pending_world, self.pending_world = self.pending_world, None
+        pending_click, self.pending_click = self.pending_click, None
+        
         if self.game_state == "MENU":
-            # Number keys or mouse click to select world
-            for i in range(1, 6):
-                if keys[getattr(pygame, f'K_{i}')]:
-                    if i - 1 < len(self.world_themes):
-                        self.start_world(i - 1)
-                        self.game_state = "PLAYING"
-                        self.score = 0
-                        break
+            # Number key press or mouse click to select world
+            if pending_world is not None and pending_world < len(self.world_themes):
+                self.start_world(pending_world)
+                self.game_state = "PLAYING"
+                self.score = 0
             
             # Mouse selection
-            if pygame.mouse.get_pressed()[0]:
-                mouse_pos = pygame.mouse.get_pos()
-                for i in range(len(self.world_themes)):
-                    y = 300 + i * 80
-                    rect = pygame.Rect(SCREEN_WIDTH // 2 - 250, y - 20, 500, 60)
-                    if rect.collidepoint(mouse_pos):
+            elif pending_click is not None:
+                for i, rect in enumerate(self.world_select_rects):
+                    if rect.collidepoint(pending_click):
                         self.start_world(i)
                         self.game_state = "PLAYING"
                         self.score = 0
@@ -1722,9 +2420,12 @@ class Game:
                 self.shoot_fireball()
         
         elif self.game_state in ["GAME_OVER", "VICTORY"]:
-            if keys[pygame.K_SPACE]:
+            # Only a fresh press leaves; a jump held through the last frame of play doesn't
+            if keys[pygame.K_SPACE] and not self.prev_keys[pygame.K_SPACE]:
                 self.game_state = "MENU"
                 self.menu_animation = 0
+        
+        self.prev_keys = keys
     
     def run(self):
         running = True
@@ -1739,6 +2440,10 @@ class Game:
                             self.game_state = "MENU"
                         else:
                             running = False
+                    elif event.key in self.WORLD_KEYS:
+                        self.pending_world = self.WORLD_KEYS.index(event.key)
+                elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                    self.pending_click = event.pos
             
             self.handle_input()
             self.update()